@@ -11,16 +11,50 @@ Usage:
     python content-generator.py --themes           # List themes
     python content-generator.py --validate         # Validate JSON structure
     python content-generator.py --export DIR       # Export to directory
+    python content-generator.py --report           # Payload byte accounting
+    python content-generator.py --similar          # Report near-duplicate art
+    python content-generator.py --dedupe           # Remove near-duplicate art
+    python content-generator.py --bundle DIR       # Per-widget-size bundles
+    python content-generator.py --fan-out FILE DIR # Per-tenant catalogs
+    python content-generator.py --watch DIR        # Rebuild on source edits
+    python content-generator.py --to-v3 FILE       # Write columnar v3 schema
+    python content-generator.py --from-v3 FILE     # Convert v3 back to v2
+    python content-generator.py --serve            # Resident daemon mode
+    python content-generator.py --pack FILE        # Write binary pack file
+    python content-generator.py --unpack FILE      # Convert pack back to JSON
+    python content-generator.py --add-image IMG..  # Add art from PGM/PPM images
+    python content-generator.py --procedural KIND  # Add a generated animation
 """
 
 import json
+import mmap
 import os
 import sys
 import argparse
+import asyncio
+import gzip
+import hashlib
 import random
+import re
+import shutil
+import signal
+import socket
+import socketserver
+import struct
+import threading
+import time
+import unicodedata
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import quote as url_quote, urlsplit
+
+try:
+    import numpy as np
+except ImportError:  # Only needed for image ingest and procedural art
+    np = None
 
 # ═══════════════════════════════════════════════════════════════════
 # Default Content Library
@@ -377,6 +411,18 @@ THEMES = {
 # Content Generator Class
 # ═══════════════════════════════════════════════════════════════════
 
+def write_atomic(path: Path, text: str):
+    """Write text to a file so readers never see a partial write."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
 class ContentGenerator:
     def __init__(self, output_path: str = "content/art-v2.json"):
         self.output_path = Path(output_path)
@@ -521,6 +567,43 @@ class ContentGenerator:
         
         return self.add_art(art)
     
+    def add_art_from_images(self, image_paths: List[str], art_id: str = None,
+                            title: str = None, theme: str = "abstract",
+                            width: int = 34, dither: bool = False,
+                            invert: bool = False, frame_duration: int = 500,
+                            workers: int = None) -> str:
+        """Add art converted from PGM/PPM images; several images become frames."""
+        paths = expand_image_paths(image_paths)
+        if not paths:
+            raise FileNotFoundError(f"No PGM/PPM images found in: {image_paths}")
+        
+        contents = convert_images(paths, width=width, dither=dither,
+                                  invert=invert, workers=workers)
+        first = Path(paths[0])
+        name = first.parent.name if Path(image_paths[0]).is_dir() else first.stem
+        metadata = {
+            "artist": "Custom",
+            "created": datetime.now().isoformat(),
+            "complexity": "medium",
+            "source": str(image_paths[0] if len(image_paths) == 1 else first.parent)
+        }
+        
+        art = {
+            "id": art_id or f"image-{int(datetime.now().timestamp())}",
+            "title": title or name.replace('-', ' ').replace('_', ' ').title(),
+            "theme": theme
+        }
+        if len(contents) == 1:
+            art.update(type="static", content=contents[0], metadata=metadata)
+        else:
+            metadata.update(complexity="high", frameCount=len(contents))
+            art.update(type="animated", metadata=metadata, frames=[
+                {"frame": i + 1, "content": content, "duration": frame_duration}
+                for i, content in enumerate(contents)
+            ])
+        
+        return self.add_art(art)
+    
     def remove_art(self, art_id: str) -> bool:
         """Remove an art piece by ID."""
         original_len = len(self.data["art"])
@@ -535,6 +618,16 @@ class ContentGenerator:
         
         return removed
     
+    def dedupe(self, threshold: float = 0.5) -> List[Dict[str, Any]]:
+        """Remove near-duplicate art, keeping one canonical piece per cluster."""
+        clusters = find_near_duplicates(self.data["art"], threshold=threshold)
+        drop = {d["id"] for cluster in clusters for d in cluster["duplicates"]}
+        if drop:
+            self.data["art"] = [a for a in self.data["art"] if a["id"] not in drop]
+            self._update_stats()
+        print(f"✓ Removed {len(drop)} near-duplicate pieces from {len(clusters)} clusters")
+        return clusters
+    
     def list_art(self, theme: str = None) -> List[Dict[str, Any]]:
         """List all art pieces, optionally filtered by theme."""
         art_list = self.data["art"]
@@ -602,11 +695,8 @@ class ContentGenerator:
         return errors
     
     def save(self):
-        """Save the content to JSON file."""
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        """Save the content to JSON file (atomically, via a temp file)."""
+        write_atomic(self.output_path, json.dumps(self.data, indent=2, ensure_ascii=False))
         
         print(f"✓ Saved to: {self.output_path}")
         print(f"  File size: {self.output_path.stat().st_size:,} bytes")
@@ -622,6 +712,46 @@ class ContentGenerator:
         
         print(f"✓ Loaded from: {self.output_path}")
         return True
+    
+    def export_size_bundles(self, output_dir: str, budgets: Dict[str, int] = None,
+                            recent: List[str] = None) -> Dict[str, Any]:
+        """Write one byte-budgeted bundle per widget size plus a report."""
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        budgets = budgets or {}
+        report = {"generated": datetime.now().isoformat(), "sizes": {}}
+        
+        for size, limits in WIDGET_SIZES.items():
+            budget = budgets.get(size, limits["byteBudget"])
+            bundle = dict(self.data)
+            bundle["art"] = []
+            bundle["systemStatus"] = dict(self.data["systemStatus"], widgetSize=size)
+            overhead = _encoded_size(bundle)
+            
+            packed = pack_bundle(self.data["art"], size, budget - overhead, recent)
+            bundle["art"] = packed["art"]
+            bundle["systemStatus"]["totalArtPieces"] = len(packed["art"])
+            
+            path = out / f"art-v2-{size}.json"
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(bundle, f, ensure_ascii=False, separators=(",", ":"))
+            
+            report["sizes"][size] = {
+                "file": path.name,
+                "budget": budget,
+                "bytes": path.stat().st_size,
+                "included": [a["id"] for a in packed["art"]],
+                "themes": packed["themes"],
+                "excluded": packed["excluded"]
+            }
+            print(f"✓ {size}: {len(packed['art'])} pieces, "
+                  f"{path.stat().st_size:,}/{budget:,} bytes -> {path}")
+        
+        report_path = out / "bundle-report.json"
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"✓ Report: {report_path}")
+        return report
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -743,10 +873,2292 @@ def generate_system_status_art(cpu: int = 0, ram: int = 0,
     }
 
 
+# ═══════════════════════════════════════════════════════════════════
+# Live Data Providers
+# ═══════════════════════════════════════════════════════════════════
+#
+# Feeds the dynamic generators from HTTP JSON sources. A provider's URL is a
+# template with a {keys} placeholder that receives a comma-separated batch,
+# e.g. "https://example.com/prices?symbols={keys}", and the response must map
+# each key to its record:
+#   crypto:  {"BTC": {"price": 64000.5, "change24h": -1.2}, ...}
+#   weather: {"London": {"condition": "rainy", "temp": 54}, ...}
+
+class ProviderError(RuntimeError):
+    """A data source failed or returned no data for a key."""
+
+
+class ConnectionPool:
+    """Minimal asyncio HTTP/1.1 client that keeps connections alive per host."""
+    
+    def __init__(self, max_per_host: int = 4, timeout: float = 10.0):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._idle = {}
+        self._limits = {}
+    
+    async def request(self, url: str, method: str = "GET",
+                      headers: Dict[str, str] = None) -> Dict[str, Any]:
+        """Send a request and return {"status", "headers", "body"}."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ProviderError(f"Unsupported URL scheme: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        host_key = (parts.scheme, parts.hostname, port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {parts.netloc}",
+                 "Connection: keep-alive", "Accept: application/json"]
+        lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        
+        limit = self._limits.setdefault(host_key, asyncio.Semaphore(self.max_per_host))
+        async with limit:
+            idle = self._idle.setdefault(host_key, [])
+            while idle:
+                reader, writer = idle.pop()
+                if writer.is_closing() or reader.at_eof():
+                    writer.close()
+                    continue
+                try:
+                    return await self._exchange(host_key, reader, writer, request)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # The server dropped an idle keep-alive connection; retry fresh
+                    continue
+            
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(parts.hostname, port, ssl=parts.scheme == "https"),
+                self.timeout
+            )
+            return await self._exchange(host_key, reader, writer, request)
+    
+    async def _exchange(self, host_key, reader, writer, request: bytes) -> Dict[str, Any]:
+        try:
+            writer.write(request)
+            await writer.drain()
+            response = await asyncio.wait_for(self._read_response(reader), self.timeout)
+        except BaseException:
+            writer.close()
+            raise
+        
+        if response.pop("keepAlive"):
+            self._idle[host_key].append((reader, writer))
+        else:
+            writer.close()
+        return response
+    
+    @staticmethod
+    async def _read_response(reader) -> Dict[str, Any]:
+        status_line = (await reader.readline()).decode("latin-1")
+        if not status_line:
+            raise ConnectionError("Connection closed before response")
+        version, status = status_line.split(" ", 2)[:2]
+        
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        
+        return {"status": int(status), "headers": headers, "body": body, "keepAlive": keep_alive}
+    
+    async def close(self):
+        """Close every idle connection."""
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+
+class RateLimiter:
+    """Token bucket: `rate` requests per second with bursts of `burst`."""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class TTLCache:
+    """Values are fresh for `ttl` seconds, then servable-but-stale for `stale_ttl` more."""
+    
+    def __init__(self, ttl: float = 60.0, stale_ttl: float = 300.0):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries = {}
+    
+    def get(self, key: str):
+        """Return (value, "fresh" | "stale" | None)."""
+        if key not in self._entries:
+            return None, None
+        value, stored = self._entries[key]
+        age = time.monotonic() - stored
+        if age < self.ttl:
+            return value, "fresh"
+        if age < self.ttl + self.stale_ttl:
+            return value, "stale"
+        del self._entries[key]
+        return None, None
+    
+    def set(self, key: str, value: Any):
+        self._entries[key] = (value, time.monotonic())
+
+
+class DataProvider:
+    """
+    Batched, cached access to one HTTP data source.
+    
+    Keys requested within `batch_window` seconds of each other share one
+    request, and a key already queued or in flight is never fetched twice.
+    Stale cache entries are returned immediately while a background refresh
+    runs (stale-while-revalidate).
+    """
+    
+    def __init__(self, url: str, pool: ConnectionPool, rate: float = 5.0, burst: int = 5,
+                 ttl: float = 60.0, stale_ttl: float = 300.0, timeout: float = 10.0,
+                 batch_window: float = 0.01, max_batch: int = 50):
+        if "{keys}" not in url:
+            raise ValueError(f"Provider URL needs a {{keys}} placeholder: {url}")
+        self.url = url
+        self.pool = pool
+        self.limiter = RateLimiter(rate, burst)
+        self.cache = TTLCache(ttl, stale_ttl)
+        self.timeout = timeout
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._pending = {}
+        self._inflight = {}
+        self._flush_task = None
+        self._refreshes = set()
+    
+    async def get(self, key: str) -> Any:
+        """Return the record for one key."""
+        value, status = self.cache.get(key)
+        if status == "fresh":
+            return value
+        future = self._schedule(key)
+        if status == "stale":
+            if not future.done():
+                # Nobody awaits a background refresh; don't warn about its errors
+                future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            return value
+        return await future
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return records for several keys; they are fetched as one batch."""
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return dict(zip(keys, values))
+    
+    def _schedule(self, key: str) -> "asyncio.Future":
+        if key in self._inflight:
+            return self._inflight[key]
+        if key not in self._pending:
+            self._pending[key] = asyncio.get_running_loop().create_future()
+            if self._flush_task is None:
+                self._flush_task = asyncio.ensure_future(self._flush())
+        return self._pending[key]
+    
+    async def _flush(self):
+        await asyncio.sleep(self.batch_window)
+        batch, self._pending, self._flush_task = self._pending, {}, None
+        self._inflight.update(batch)
+        keys = list(batch)
+        chunks = [keys[i:i + self.max_batch] for i in range(0, len(keys), self.max_batch)]
+        await asyncio.gather(*(self._fetch({k: batch[k] for k in chunk}) for chunk in chunks))
+    
+    async def _fetch(self, futures: Dict[str, "asyncio.Future"]):
+        try:
+            await self.limiter.acquire()
+            url = self.url.format(keys=url_quote(",".join(futures), safe=","))
+            response = await asyncio.wait_for(self.pool.request(url), self.timeout)
+            if response["status"] != 200:
+                raise ProviderError(f"HTTP {response['status']} from {url}")
+            records = json.loads(response["body"])
+            
+            for key, future in futures.items():
+                if key in records:
+                    self.cache.set(key, records[key])
+                    future.set_result(records[key])
+                else:
+                    future.set_exception(ProviderError(f"No data for '{key}'"))
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                e = ProviderError(f"Timed out after {self.timeout}s")
+            elif isinstance(e, OSError):
+                e = ProviderError(f"Connection failed: {e}")
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for key in futures:
+                self._inflight.pop(key, None)
+
+
+async def fetch_crypto_art(provider: DataProvider, symbols: List[str]) -> List[Dict[str, Any]]:
+    """Generate crypto art for several symbols from one batched fetch."""
+    records = await provider.get_many([s.upper() for s in symbols])
+    return [generate_crypto_art(symbol, float(record["price"]), float(record["change24h"]))
+            for symbol, record in records.items()]
+
+
+async def fetch_weather_art(provider: DataProvider, locations: List[str]) -> List[Dict[str, Any]]:
+    """Generate weather art for several locations from one batched fetch."""
+    records = await provider.get_many(locations)
+    art_list = []
+    for location, record in records.items():
+        art = generate_weather_art(record["condition"], int(record["temp"]))
+        # Several locations are generated in the same second; keep IDs apart
+        slug = re.sub(r"[^a-z0-9]+", "-", location.lower()).strip("-")
+        art["id"] = f"weather-{slug}-{int(datetime.now().timestamp())}"
+        art["metadata"]["location"] = location
+        art_list.append(art)
+    return art_list
+
+
+def fetch_dynamic_art(kind: str, keys: List[str], url: str,
+                      timeout: float = 10.0) -> List[Dict[str, Any]]:
+    """Synchronous entry point for the CLI: fetch live data and build art."""
+    async def run():
+        pool = ConnectionPool(timeout=timeout)
+        try:
+            provider = DataProvider(url, pool, timeout=timeout)
+            if kind == "crypto":
+                return await fetch_crypto_art(provider, keys)
+            return await fetch_weather_art(provider, keys)
+        finally:
+            await pool.close()
+    
+    return asyncio.run(run())
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Near-Duplicate Detection
+# ═══════════════════════════════════════════════════════════════════
+#
+# Each piece is reduced to the set of its normalized lines (whitespace
+# collapsed) across all of its frames, and that set to a MinHash signature.
+# Dynamic cards also have digit runs replaced by "0", so a refreshed card only
+# differs where its wording does, and key every line by their feed (the ID
+# minus its trailing timestamp), so BTC and ETH cards, or two weather
+# locations, never match each other. LSH banding buckets signatures
+# that agree on a whole band, so only pieces sharing a bucket are compared.
+
+_DIGITS = re.compile(r"[0-9]+")
+_FEED_SUFFIX = re.compile(r"-?[0-9]+$")
+
+
+def _body_shingles(body: str, feed: Optional[str] = None) -> frozenset:
+    """CRC32 hashes of the normalized lines of one body; a dynamic card's `feed` masks digits."""
+    lines = [" ".join(line.split()) for line in body.split("\n")]
+    prefix = ""
+    if feed is not None:
+        lines = [_DIGITS.sub("0", line) for line in lines]
+        prefix = feed + "\0"
+    return frozenset(zlib.crc32((prefix + line).encode("utf-8")) for line in lines if line)
+
+
+def _shingle_hashes(art: Dict[str, Any],
+                    memo: Dict[Tuple[Optional[str], str], frozenset]) -> List[int]:
+    """Shingle hashes across every body of a piece; `memo` shares repeated bodies."""
+    feed = None
+    if art.get("metadata", {}).get("dynamic"):
+        feed = _FEED_SUFFIX.sub("", art["id"])
+    shingles = set()
+    for body in art_contents(art):
+        if (feed, body) not in memo:
+            memo[feed, body] = _body_shingles(body, feed)
+        shingles |= memo[feed, body]
+    return sorted(shingles)
+
+
+def minhash_signatures(art_list: List[Dict[str, Any]], num_perm: int = 128,
+                       seed: int = 1, chunk_size: int = 16384) -> "np.ndarray":
+    """
+    MinHash signatures, one row per piece.
+    
+    All shingle hashes go into one flat array; each permutation is a
+    multiply-shift hash over it, and np.minimum.reduceat takes the minimum
+    per piece, a chunk of shingles at a time to bound memory.
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+    
+    memo = {}
+    hashes = [_shingle_hashes(art, memo) for art in art_list]
+    lengths = np.array([len(h) for h in hashes], dtype=np.int64)
+    flat = np.fromiter((x for h in hashes for x in h), dtype=np.uint64, count=int(lengths.sum()))
+    
+    signatures = np.full((len(art_list), num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+    pieces = np.repeat(np.arange(len(art_list)), lengths)
+    for lo in range(0, len(flat), chunk_size):
+        chunk = flat[lo:lo + chunk_size]
+        values = (chunk[:, None] * a[None, :] + b[None, :]) >> np.uint64(32)
+        owners = pieces[lo:lo + chunk_size]
+        # Segment boundaries of the pieces covered by this chunk
+        bounds = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        mins = np.minimum.reduceat(values, bounds, axis=0)
+        rows = owners[bounds]
+        signatures[rows] = np.minimum(signatures[rows], mins)
+    
+    # Pieces without any text all share one signature
+    signatures[lengths == 0] = 0
+    return signatures
+
+
+def find_near_duplicates(art_list: List[Dict[str, Any]], threshold: float = 0.5,
+                         num_perm: int = 128, bands: int = 32) -> List[Dict[str, Any]]:
+    """
+    Group pieces whose estimated Jaccard similarity reaches `threshold`.
+    
+    The default 0.5 sits well below refreshed data cards (same feed, new
+    numbers: 0.8-1.0; about 0.64 when a weather condition changes) and well
+    above distinct pieces in the default library (at most about 0.1). 32
+    bands of 4 rows make pairs above ~0.42 likely to share a bucket.
+    
+    Each cluster names a canonical piece to keep and the duplicates to drop,
+    each at least `threshold` similar to it. Dynamic pieces (live data cards)
+    keep their most recent copy; otherwise the earliest piece in the catalog
+    is canonical.
+    """
+    if num_perm % bands:
+        raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+    if not art_list:
+        return []
+    
+    signatures = minhash_signatures(art_list, num_perm)
+    rows = num_perm // bands
+    parent = list(range(len(art_list)))
+    
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    pairs = []
+    mixer = np.random.default_rng(seed=0).integers(1, 2 ** 63, size=rows, dtype=np.uint64) | np.uint64(1)
+    for band in range(bands):
+        # One 64-bit key per piece and band; collisions are caught by verification
+        keys = (signatures[:, band * rows:(band + 1) * rows] * mixer).sum(axis=1)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        run_first = np.repeat(order[starts], np.diff(np.r_[starts, len(order)]))
+        
+        # Verify every bucket member against its bucket's first member only,
+        # so a bucket of thousands of identical cards stays linear
+        members = order[order != run_first]
+        firsts = run_first[order != run_first]
+        if not len(members):
+            continue
+        similarity = (signatures[members] == signatures[firsts]).mean(axis=1)
+        keep = similarity >= threshold
+        pairs.append(np.stack([members[keep], firsts[keep]], axis=1))
+    
+    # The same pair usually matches in many bands; union each pair once
+    if pairs:
+        for i, first in np.unique(np.concatenate(pairs), axis=0).tolist():
+            parent[root(i)] = root(first)
+    
+    groups = {}
+    for i in range(len(art_list)):
+        groups.setdefault(root(i), []).append(i)
+    
+    clusters = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        dynamic = [art_list[i].get("metadata", {}).get("dynamic") for i in members]
+        if all(dynamic):
+            keep = members[-1]
+        else:
+            keep = next(i for i, d in zip(members, dynamic) if not d)
+        similarity = (signatures[members] == signatures[keep]).mean(axis=1)
+        duplicates = [
+            {"id": art_list[i]["id"], "similarity": round(float(sim), 3),
+             "bytes": _encoded_size(art_list[i])}
+            for i, sim in zip(members, similarity) if i != keep and sim >= threshold
+        ]
+        # Clusters are chained pairwise; members short of `keep` itself stay
+        if not duplicates:
+            continue
+        clusters.append({
+            "keep": art_list[keep]["id"],
+            "duplicates": duplicates,
+            "bytes": sum(d["bytes"] for d in duplicates)
+        })
+    
+    clusters.sort(key=lambda c: c["bytes"], reverse=True)
+    return clusters
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Payload Accounting
+# ═══════════════════════════════════════════════════════════════════
+#
+# Attributes every byte of the saved JSON (indent=2, UTF-8) to a category:
+#   content / frames / metadata   values under those keys of an art piece
+#   fields                        other art values (id, title, theme, type)
+#   other                         values outside "art" (themes, quotes, ...)
+#   keys                          object keys with their quotes and colon
+#   whitespace                    newlines, indentation, space after colons
+#   structure                     braces, brackets and commas
+
+PAYLOAD_CATEGORIES = ("content", "frames", "metadata", "fields", "other",
+                      "keys", "whitespace", "structure")
+_ART_KEY_CATEGORIES = {"content": "content", "frames": "frames", "metadata": "metadata"}
+
+
+def _json_len(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+def _tally_json(value: Any, level: int, category: str, tally: Dict[str, int],
+                key_categories: Dict[str, str] = None):
+    """Add the bytes json.dumps(indent=2) emits for `value` to `tally`."""
+    if isinstance(value, (dict, list)) and value:
+        items = list(value.items()) if isinstance(value, dict) else list(enumerate(value))
+        tally["structure"] += 2 + len(items) - 1
+        # "\n" + indent before every item and before the closing bracket
+        tally["whitespace"] += len(items) * (1 + 2 * (level + 1)) + 1 + 2 * level
+        for key, item in items:
+            if isinstance(value, dict):
+                tally["keys"] += _json_len(str(key)) + 1
+                tally["whitespace"] += 1
+            child = key_categories.get(key, category) if key_categories else category
+            _tally_json(item, level + 1, child, tally)
+    else:
+        tally[category] += _json_len(value)
+
+
+def _redundancy(art_list: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Bytes spent on bodies and lines that already appeared earlier."""
+    seen_bodies = set()
+    seen_lines = set()
+    result = {"duplicateBodies": 0, "duplicateBodyBytes": 0,
+              "duplicateLines": 0, "duplicateLineBytes": 0}
+    for art in art_list:
+        for body in art_contents(art):
+            if body in seen_bodies:
+                result["duplicateBodies"] += 1
+                result["duplicateBodyBytes"] += _json_len(body)
+                continue
+            seen_bodies.add(body)
+            for line in body.split("\n"):
+                if line.strip() and line in seen_lines:
+                    result["duplicateLines"] += 1
+                    # Quotes counted by _json_len stand in for the escaped "\n"
+                    result["duplicateLineBytes"] += _json_len(line)
+                seen_lines.add(line)
+    return result
+
+
+def payload_report(data: Dict[str, Any], top: int = 10) -> Dict[str, Any]:
+    """Break the saved size of a catalog down by section, category, theme and piece."""
+    encoded = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    compact = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    categories = dict.fromkeys(PAYLOAD_CATEGORIES, 0)
+    sections = {}
+    pieces = []
+    
+    # Root object: braces, commas, newlines and the top-level keys
+    categories["structure"] += 2 + max(0, len(data) - 1)
+    categories["whitespace"] += len(data) * 4 + 1 if data else 0
+    for key, value in data.items():
+        categories["keys"] += _json_len(key) + 1
+        section = dict.fromkeys(PAYLOAD_CATEGORIES, 0)
+        if key == "art" and isinstance(value, list) and value:
+            section["structure"] += 2
+            section["whitespace"] += 1 + 2
+            for i, art in enumerate(value):
+                tally = dict.fromkeys(PAYLOAD_CATEGORIES, 0)
+                tally["whitespace"] += 1 + 4
+                tally["structure"] += 1 if i < len(value) - 1 else 0
+                _tally_json(art, 2, "fields", tally, _ART_KEY_CATEGORIES)
+                pieces.append({
+                    "id": art.get("id"),
+                    "theme": art.get("theme"),
+                    "bytes": sum(tally.values()),
+                    "categories": tally
+                })
+                for cat, size in tally.items():
+                    section[cat] += size
+        else:
+            _tally_json(value, 1, "other", section)
+        sections[key] = sum(section.values())
+        for cat, size in section.items():
+            categories[cat] += size
+    
+    themes = {}
+    for piece in pieces:
+        themes[piece["theme"]] = themes.get(piece["theme"], 0) + piece["bytes"]
+    
+    total = len(encoded)
+    if sum(categories.values()) != total:
+        raise ValueError(f"Payload accounting covers {sum(categories.values()):,} of "
+                         f"{total:,} bytes; it is out of sync with json.dumps")
+    
+    return {
+        "total": total,
+        "compact": len(compact),
+        "gzip": len(gzip.compress(encoded, mtime=0)),
+        "gzipCompact": len(gzip.compress(compact, mtime=0)),
+        "sections": sections,
+        "categories": categories,
+        "themes": themes,
+        "pieces": pieces,
+        "top": sorted(pieces, key=lambda p: p["bytes"], reverse=True)[:top],
+        "redundancy": _redundancy(data.get("art", []))
+    }
+
+
+def diff_payload_reports(old: Dict[str, Any], new: Dict[str, Any], top: int = 10) -> Dict[str, Any]:
+    """Compare two payload reports: totals, categories, themes and per-piece growth."""
+    def delta(a: Dict[str, int], b: Dict[str, int]) -> Dict[str, int]:
+        return {k: b.get(k, 0) - a.get(k, 0) for k in list(a) + [k for k in b if k not in a]}
+    
+    old_pieces = {p["id"]: p["bytes"] for p in old["pieces"]}
+    new_pieces = {p["id"]: p["bytes"] for p in new["pieces"]}
+    changes = [
+        {"id": art_id, "old": old_pieces.get(art_id), "new": new_pieces.get(art_id),
+         "delta": new_pieces.get(art_id, 0) - old_pieces.get(art_id, 0)}
+        for art_id in list(old_pieces) + [i for i in new_pieces if i not in old_pieces]
+        if old_pieces.get(art_id) != new_pieces.get(art_id)
+    ]
+    changes.sort(key=lambda c: abs(c["delta"]), reverse=True)
+    
+    return {
+        "total": new["total"] - old["total"],
+        "gzip": new["gzip"] - old["gzip"],
+        "categories": delta(old["categories"], new["categories"]),
+        "themes": delta(old["themes"], new["themes"]),
+        "added": [i for i in new_pieces if i not in old_pieces],
+        "removed": [i for i in old_pieces if i not in new_pieces],
+        "changes": changes[:top]
+    }
+
+
+def check_payload_budget(report: Dict[str, Any], max_bytes: int = None,
+                         max_piece_bytes: int = None) -> List[str]:
+    """Return budget violations for a payload report (empty if within budget)."""
+    violations = []
+    if max_bytes is not None and report["total"] > max_bytes:
+        violations.append(f"Catalog is {report['total']:,} bytes (budget {max_bytes:,})")
+    if max_piece_bytes is not None:
+        for piece in report["pieces"]:
+            if piece["bytes"] > max_piece_bytes:
+                violations.append(f"{piece['id']} is {piece['bytes']:,} bytes "
+                                  f"(budget {max_piece_bytes:,})")
+    return violations
+
+
+def print_payload_report(report: Dict[str, Any]):
+    total = report["total"]
+    print("\n📦 Payload Report")
+    print("=" * 40)
+    print(f"Saved size:   {total:,} bytes (gzip {report['gzip']:,})")
+    print(f"Compact size: {report['compact']:,} bytes (gzip {report['gzipCompact']:,})")
+    
+    print("\nBy Section:")
+    for section, size in sorted(report["sections"].items(), key=lambda s: -s[1]):
+        print(f"  {section:<14} {size:>10,}  {size / total:>6.1%}")
+    
+    print("\nBy Field Type:")
+    for cat, size in sorted(report["categories"].items(), key=lambda c: -c[1]):
+        print(f"  {cat:<14} {size:>10,}  {size / total:>6.1%}")
+    
+    print("\nArt By Theme:")
+    for theme, size in sorted(report["themes"].items(), key=lambda t: -t[1]):
+        print(f"  {str(theme):<14} {size:>10,}  {size / total:>6.1%}")
+    
+    print(f"\nTop {len(report['top'])} Pieces:")
+    for piece in report["top"]:
+        cats = piece["categories"]
+        print(f"  {str(piece['id']):<30} {piece['bytes']:>8,}  "
+              f"(body {cats['content'] + cats['frames']:,}, meta {cats['metadata']:,}, "
+              f"keys {cats['keys']:,}, ws {cats['whitespace']:,})")
+    
+    red = report["redundancy"]
+    print("\nRedundancy:")
+    print(f"  Duplicate bodies: {red['duplicateBodies']} ({red['duplicateBodyBytes']:,} bytes)")
+    print(f"  Duplicate lines:  {red['duplicateLines']} ({red['duplicateLineBytes']:,} bytes)")
+
+
+def print_payload_diff(diff: Dict[str, Any]):
+    print("\n📦 Payload Diff")
+    print("=" * 40)
+    print(f"Total: {diff['total']:+,} bytes (gzip {diff['gzip']:+,})")
+    
+    print("\nBy Field Type:")
+    for cat, size in diff["categories"].items():
+        if size:
+            print(f"  {cat:<14} {size:>+10,}")
+    
+    print("\nArt By Theme:")
+    for theme, size in diff["themes"].items():
+        if size:
+            print(f"  {str(theme):<14} {size:>+10,}")
+    
+    print(f"\nAdded: {len(diff['added'])}  Removed: {len(diff['removed'])}")
+    for change in diff["changes"]:
+        print(f"  {str(change['id']):<30} {change['delta']:>+8,}")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Image Ingest (PGM/PPM -> ASCII)
+# ═══════════════════════════════════════════════════════════════════
+
+# Glyphs from darkest to brightest
+GLYPH_RAMP = " ░▒▓█"
+
+# 4x4 ordered-dither thresholds, normalised to [-0.5, 0.5)
+_BAYER_4X4 = [
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5]
+]
+
+IMAGE_EXTENSIONS = (".pgm", ".ppm", ".pnm")
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("NumPy is required for this feature (pip install numpy)")
+
+
+def read_pnm(file_path: str) -> "np.ndarray":
+    """Read a PGM/PPM image (P2, P3, P5 or P6) as luminance in [0, 1]."""
+    _require_numpy()
+    raw = Path(file_path).read_bytes()
+    
+    # Header: magic, width, height, maxval; '#' comments allowed between tokens
+    tokens = []
+    pos = 0
+    while len(tokens) < 4:
+        while pos < len(raw) and raw[pos:pos + 1].isspace():
+            pos += 1
+        if raw[pos:pos + 1] == b"#":
+            pos = raw.index(b"\n", pos)
+            continue
+        start = pos
+        while pos < len(raw) and not raw[pos:pos + 1].isspace():
+            pos += 1
+        if start == pos:
+            raise ValueError(f"Truncated PNM header: {file_path}")
+        tokens.append(raw[start:pos].decode("ascii"))
+    
+    magic = tokens[0]
+    if magic not in ("P2", "P3", "P5", "P6"):
+        raise ValueError(f"Unsupported PNM format '{magic}': {file_path}")
+    width, height, maxval = (int(t) for t in tokens[1:])
+    channels = 3 if magic in ("P3", "P6") else 1
+    count = width * height * channels
+    
+    if magic in ("P5", "P6"):
+        dtype = ">u2" if maxval > 255 else "u1"
+        pixels = np.frombuffer(raw, dtype=dtype, count=count, offset=pos + 1)
+    else:
+        pixels = np.array(raw[pos:].split()[:count], dtype=np.uint32)
+    if pixels.size != count:
+        raise ValueError(f"Truncated PNM data: {file_path}")
+    
+    image = pixels.astype(np.float32).reshape(height, width, channels) / maxval
+    if channels == 3:
+        # Rec. 601 luma
+        return image @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    return image[:, :, 0]
+
+
+def frames_to_ascii(frames: "np.ndarray", width: int = 34, ramp: str = GLYPH_RAMP,
+                    dither: bool = False, invert: bool = False) -> List[str]:
+    """
+    Convert a stack of same-sized luminance images (n, h, w) to ASCII.
+    
+    Each output cell block-averages a w/width wide, twice-as-tall patch
+    (terminal cells are roughly 1:2), so the whole stack is downsampled,
+    dithered and mapped to glyphs in a handful of array operations.
+    """
+    _require_numpy()
+    n, h, w = frames.shape
+    cols = max(1, min(width, w))
+    block_w = w // cols
+    block_h = min(h, block_w * 2)
+    rows = max(1, h // block_h)
+    
+    cropped = frames[:, :rows * block_h, :cols * block_w]
+    cells = cropped.reshape(n, rows, block_h, cols, block_w).mean(axis=(2, 4))
+    if invert:
+        cells = 1.0 - cells
+    
+    levels = len(ramp) - 1
+    scaled = cells * levels
+    if dither:
+        bayer = (np.array(_BAYER_4X4, dtype=np.float32) + 0.5) / 16 - 0.5
+        scaled = scaled + np.tile(bayer, (rows // 4 + 1, cols // 4 + 1))[:rows, :cols]
+    indices = np.clip(np.rint(scaled), 0, levels).astype(np.intp)
+    
+    glyphs = np.array(list(ramp))[indices]
+    return ["\n".join("".join(row).rstrip() for row in frame) for frame in glyphs]
+
+
+def _convert_image_batch(paths: List[str], width: int, ramp: str,
+                         dither: bool, invert: bool) -> List[str]:
+    """Pool worker: read a chunk of images and convert same-sized runs together."""
+    images = [read_pnm(p) for p in paths]
+    results = []
+    start = 0
+    while start < len(images):
+        end = start + 1
+        while end < len(images) and images[end].shape == images[start].shape:
+            end += 1
+        results.extend(frames_to_ascii(np.stack(images[start:end]), width, ramp, dither, invert))
+        start = end
+    return results
+
+
+def convert_images(paths: List[str], width: int = 34, ramp: str = GLYPH_RAMP,
+                   dither: bool = False, invert: bool = False,
+                   workers: int = None, chunk_size: int = 32) -> List[str]:
+    """Convert many images to ASCII, spreading chunks over a process pool."""
+    _require_numpy()
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    if len(chunks) <= 1 or workers == 1:
+        return [text for chunk in chunks
+                for text in _convert_image_batch(chunk, width, ramp, dither, invert)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_convert_image_batch, chunk, width, ramp, dither, invert)
+                   for chunk in chunks]
+        return [text for future in futures for text in future.result()]
+
+
+def frame_sort_key(path: Path):
+    """Sort key putting frame_2 before frame_10."""
+    digits = re.findall(r"\d+", path.stem)
+    return (int(digits[-1]) if digits else -1, path.name)
+
+
+def expand_image_paths(paths: List[str]) -> List[str]:
+    """Expand directories into their image files, in numeric frame order."""
+    expanded = []
+    for p in paths:
+        path = Path(p)
+        if path.is_dir():
+            files = [f for f in path.iterdir() if f.suffix.lower() in IMAGE_EXTENSIONS]
+            expanded.extend(str(f) for f in sorted(files, key=frame_sort_key))
+        elif not path.exists():
+            raise FileNotFoundError(f"Image not found: {p}")
+        else:
+            expanded.append(str(path))
+    return expanded
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Procedural Animations
+# ═══════════════════════════════════════════════════════════════════
+
+RAIN_GLYPHS = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿ01"
+HEX_DIGITS = [f"{b:02X}" for b in range(256)]
+
+
+def _grid_to_frames(grid: "np.ndarray", indent: str = "    ") -> List[str]:
+    """Join a (frames, rows, cols) array of single characters into frame strings."""
+    n, rows, cols = grid.shape
+    lines = np.ascontiguousarray(grid, dtype="<U1").view(f"<U{cols}").reshape(n, rows)
+    return ["\n".join(indent + line.rstrip() for line in frame) for frame in lines]
+
+
+def generate_rain_frames(seed: int, frame_count: int = 24, width: int = 30,
+                         height: int = 8, trail: int = 4) -> List[str]:
+    """
+    Digital rain: every column carries a drop with its own speed and phase.
+    
+    Drops travel a loop of `cycle` rows, a multiple of `frame_count`, and
+    move a whole multiple of cycle/frame_count rows per frame, so the last
+    frame leads straight back into the first.
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    laps = -(-(height + trail) // frame_count)
+    cycle = frame_count * laps
+    
+    offset = rng.integers(0, cycle, size=width)
+    speed = rng.integers(1, 3, size=width) * laps
+    glyphs = np.array(list(RAIN_GLYPHS))[rng.integers(0, len(RAIN_GLYPHS), size=(height, width))]
+    # Leave every other column empty so the rain reads as distinct streams
+    active = (np.arange(width) % 2 == 0) & (rng.random(width) < 0.85)
+    
+    t = np.arange(frame_count)[:, None, None]
+    rows = np.arange(height)[None, :, None]
+    head = (offset + t * speed) % cycle
+    dist = (head - rows) % cycle
+    
+    grid = np.full((frame_count, height, width), " ", dtype="<U1")
+    grid = np.where((dist < trail - 1) & active, glyphs, grid)
+    grid = np.where((dist == trail - 1) & active, "┃", grid)
+    return _grid_to_frames(grid)
+
+
+def generate_progress_frames(seed: int, frame_count: int = 24, width: int = 30,
+                             label: str = "LOADING") -> List[str]:
+    """
+    Progress bar filling from 0% to 100% over the loop.
+    
+    The seed shapes the pace (uneven stalls and bursts, like a real loader)
+    while the fill stays monotonic; sub-cell progress is drawn with ▒.
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    steps = rng.exponential(1.0, size=frame_count - 1)
+    fill = np.concatenate([[0.0], np.cumsum(steps) / steps.sum()]) if frame_count > 1 else np.ones(1)
+    
+    bar_width = max(4, width - 10)
+    cells = np.clip(fill[:, None] * bar_width - np.arange(bar_width)[None, :], 0.0, 1.0)
+    bars = np.where(cells >= 1.0, "▓", np.where(cells > 0.0, "▒", "░"))
+    bar_lines = np.ascontiguousarray(bars, dtype="<U1").view(f"<U{bar_width}")[:, 0]
+    percents = np.rint(fill * 100).astype(int)
+    
+    return [
+        f"    {label}...\n\n    [{bar}] {pct:>3}%"
+        for bar, pct in zip(bar_lines, percents)
+    ]
+
+
+def generate_stream_frames(seed: int, frame_count: int = 24, width: int = 30,
+                           height: int = 6) -> List[str]:
+    """
+    Hex data stream scrolling one line per frame.
+    
+    The stream is a ring of `frame_count` lines, so after the last frame
+    the view is back where it started.
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    per_line = max(1, (width - 8) // 3)
+    data = rng.integers(0, 256, size=(frame_count, per_line))
+    base = int(rng.integers(0, 0x10000))
+    
+    hex_cells = np.array(HEX_DIGITS)[data]
+    # Addresses wrap like a 16-bit counter, however long the stream
+    ring = [f"0x{(base + i * per_line) % 0x10000:04X}: " + " ".join(cells)
+            for i, cells in enumerate(hex_cells)]
+    ring = np.array(ring)
+    
+    window = (np.arange(frame_count)[:, None] + np.arange(height)[None, :]) % frame_count
+    header = "    ░▒▓█ DATA STREAM █▓▒░"
+    return [header + "\n" + "\n".join("    " + line for line in view)
+            for view in ring[window]]
+
+
+PROCEDURAL_GENERATORS = {
+    "rain": {"frames": generate_rain_frames, "title": "Procedural Rain", "theme": "matrix"},
+    "progress": {"frames": generate_progress_frames, "title": "Procedural Loading", "theme": "retro"},
+    "stream": {"frames": generate_stream_frames, "title": "Procedural Stream", "theme": "cyberpunk"}
+}
+
+
+def generate_procedural_art(kind: str, seed: int = 0, frame_count: int = 24,
+                            width: int = 30, frame_duration: int = 200) -> Dict[str, Any]:
+    """Generate a seamless animated piece; metadata records how to regenerate it."""
+    if kind not in PROCEDURAL_GENERATORS:
+        raise ValueError(f"Unknown generator '{kind}' "
+                         f"(choose from: {', '.join(PROCEDURAL_GENERATORS)})")
+    if frame_count < 1:
+        raise ValueError("frame_count must be at least 1")
+    
+    spec = PROCEDURAL_GENERATORS[kind]
+    contents = spec["frames"](seed, frame_count=frame_count, width=width)
+    
+    return {
+        "id": f"{kind}-{seed}-{frame_count}-w{width}-d{frame_duration}",
+        "title": spec["title"],
+        "theme": spec["theme"],
+        "type": "animated",
+        "frames": [
+            {"frame": i + 1, "content": content, "duration": frame_duration}
+            for i, content in enumerate(contents)
+        ],
+        "metadata": {
+            "artist": "Procedural",
+            "created": datetime.now().isoformat(),
+            "complexity": "high",
+            "frameCount": len(contents),
+            "generator": kind,
+            "seed": seed,
+            "width": width
+        }
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Widget Size Bundles
+# ═══════════════════════════════════════════════════════════════════
+
+# Display limits (in terminal cells) and default byte budgets per widget
+# family. Budgets cover the whole compact-encoded bundle, not just the art.
+WIDGET_SIZES = {
+    "small": {"maxWidth": 30, "maxHeight": 10, "byteBudget": 12 * 1024},
+    "medium": {"maxWidth": 44, "maxHeight": 14, "byteBudget": 24 * 1024},
+    "large": {"maxWidth": 60, "maxHeight": 30, "byteBudget": 48 * 1024}
+}
+
+
+def _display_width(line: str) -> int:
+    """Width of a line in monospace cells (wide glyphs take two)."""
+    width = 0
+    for ch in line:
+        if unicodedata.combining(ch) or ch in "‍︎️":
+            continue
+        width += 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+    return width
+
+
+def art_contents(art: Dict[str, Any]) -> List[str]:
+    """Return every text body of a piece (one for static, one per frame)."""
+    if art.get("type") == "animated":
+        return [frame["content"] for frame in art.get("frames", [])]
+    return [art.get("content", "")]
+
+
+def measure_art(art: Dict[str, Any]) -> Dict[str, int]:
+    """Measure the display dimensions and encoded size of an art piece."""
+    width = height = 0
+    for content in art_contents(art):
+        lines = content.split("\n")
+        height = max(height, len(lines))
+        width = max(width, max((_display_width(l) for l in lines), default=0))
+    return {"width": width, "height": height, "bytes": _encoded_size(art)}
+
+
+def _encoded_size(obj: Any) -> int:
+    """Size of an object in compact UTF-8 JSON."""
+    return len(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def classify_art(art: Dict[str, Any]) -> List[str]:
+    """Return the widget sizes an art piece fits on."""
+    dims = measure_art(art)
+    return [size for size, limits in WIDGET_SIZES.items()
+            if dims["width"] <= limits["maxWidth"] and dims["height"] <= limits["maxHeight"]]
+
+
+def pack_bundle(art_list: List[Dict[str, Any]], size: str, budget: int,
+                recent: List[str] = None) -> Dict[str, Any]:
+    """
+    Pick the best set of pieces for one widget size within a byte budget.
+
+    Pieces that don't fit the display are excluded up front. The rest are
+    packed greedily by value per byte, where a piece's value drops for each
+    piece of the same theme already picked (theme balance) and for how
+    recently it was shown (`recent` lists IDs, most recent first).
+    """
+    limits = WIDGET_SIZES[size]
+    recent_rank = {art_id: i for i, art_id in enumerate(recent or [])}
+    excluded = []
+    candidates = []
+
+    for art in art_list:
+        dims = measure_art(art)
+        if dims["width"] > limits["maxWidth"]:
+            excluded.append({"id": art["id"], "reason": "too-wide",
+                             "detail": f"{dims['width']} > {limits['maxWidth']} columns"})
+        elif dims["height"] > limits["maxHeight"]:
+            excluded.append({"id": art["id"], "reason": "too-tall",
+                             "detail": f"{dims['height']} > {limits['maxHeight']} lines"})
+        elif dims["bytes"] > budget:
+            excluded.append({"id": art["id"], "reason": "over-budget",
+                             "detail": f"{dims['bytes']:,} > {budget:,} bytes"})
+        else:
+            # Recently shown pieces are worth less; unseen ones keep full value
+            if art["id"] in recent_rank:
+                freshness = (recent_rank[art["id"]] + 1) / (len(recent_rank) + 1)
+            else:
+                freshness = 1.0
+            # One extra byte for the separating comma in the art array
+            candidates.append((art, dims["bytes"] + 1, freshness))
+
+    selected = []
+    theme_counts = {}
+    remaining = budget
+    while candidates:
+        best = max(
+            candidates,
+            key=lambda c: c[2] / (1 + theme_counts.get(c[0]["theme"], 0)) / c[1]
+        )
+        candidates.remove(best)
+        art, cost, _ = best
+        if cost > remaining:
+            excluded.append({"id": art["id"], "reason": "budget-exhausted",
+                             "detail": f"{cost:,} bytes, {remaining:,} left"})
+            continue
+        selected.append(art)
+        remaining -= cost
+        theme_counts[art["theme"]] = theme_counts.get(art["theme"], 0) + 1
+
+    # Keep catalog order so bundles diff cleanly between runs
+    order = {a["id"]: i for i, a in enumerate(art_list)}
+    selected.sort(key=lambda a: order[a["id"]])
+
+    return {
+        "size": size,
+        "art": selected,
+        "bytes": budget - remaining,
+        "themes": theme_counts,
+        "excluded": excluded
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Multi-Tenant Fan-Out
+# ═══════════════════════════════════════════════════════════════════
+#
+# Tenants file:
+#   {"tenants": [{"id": "alice",
+#                 "config": {"defaultTheme": "matrix", "easterEggProbability": 0.1},
+#                 "themes": ["matrix", "retro"],
+#                 "pinned": ["matrix-rain"]}]}
+#
+# "config" is merged over the base config, "themes" restricts art, quotes and
+# theme palettes (omit for all), and "pinned" pieces always ship, first, along
+# with their theme palettes. An explicit defaultTheme must be a shipped theme;
+# an inherited one that isn't falls back to the first shipped theme.
+
+_ART_PLACEHOLDER = "\0ART\0"
+_TENANT_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+# Per-worker state, set once by _init_fanout rather than sent with every tenant
+_fanout_base = None
+_fanout_fragments = None
+
+
+def _encode_art_fragments(art_list: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Encode each piece once, pre-indented to sit inside the "art" array."""
+    fragments = {}
+    for art in art_list:
+        text = json.dumps(art, indent=2, ensure_ascii=False)
+        fragments[art["id"]] = "\n".join("    " + line for line in text.split("\n"))
+    return fragments
+
+
+def render_catalog_text(doc: Dict[str, Any], art_ids: List[str],
+                        fragments: Dict[str, str]) -> str:
+    """Serialize a catalog like save() does, splicing in pre-encoded pieces as "art"."""
+    art_json = "[]"
+    if art_ids:
+        art_json = "[\n" + ",\n".join(fragments[i] for i in art_ids) + "\n  ]"
+    text = json.dumps(dict(doc, art=_ART_PLACEHOLDER), indent=2, ensure_ascii=False)
+    return text.replace(json.dumps(_ART_PLACEHOLDER), art_json, 1)
+
+
+def _init_fanout(base: Dict[str, Any], fragments: Dict[str, str]):
+    global _fanout_base, _fanout_fragments
+    _fanout_base = base
+    _fanout_fragments = fragments
+
+
+def _tenant_selection(tenant: Dict[str, Any], base: Dict[str, Any]):
+    """Return (art_ids, shipped theme names) for a tenant, pinned pieces first."""
+    allowed = set(tenant.get("themes") or base["themes"])
+    pinned = tenant.get("pinned", [])
+    pinned_set = set(pinned)
+    themes_by_id = {art["id"]: art["theme"] for art in base["art"]}
+    
+    art_ids = [art_id for art_id in pinned if art_id in themes_by_id]
+    art_ids += [art["id"] for art in base["art"]
+                if art["theme"] in allowed and art["id"] not in pinned_set]
+    
+    # Pinned pieces ship outside the allowed themes, so their palettes must too
+    shipped = allowed | {themes_by_id[art_id] for art_id in art_ids}
+    return art_ids, [name for name in base["themes"] if name in shipped]
+
+
+def _render_tenant(tenant: Dict[str, Any], output_dir: str) -> Dict[str, Any]:
+    """Pool worker: assemble and write one tenant's catalog."""
+    base = _fanout_base
+    allowed = set(tenant.get("themes") or base["themes"])
+    pinned = tenant.get("pinned", [])
+    art_ids, shipped = _tenant_selection(tenant, base)
+    
+    doc = dict(base)
+    doc["config"] = dict(base["config"], **tenant.get("config", {}))
+    doc["themes"] = {name: base["themes"][name] for name in shipped}
+    
+    # Explicit defaults are checked up front; an inherited one that was
+    # filtered out falls back to the first theme that ships
+    fallback_theme = None
+    default_theme = doc["config"].get("defaultTheme")
+    if default_theme is not None and default_theme not in shipped and shipped:
+        fallback_theme = shipped[0]
+        doc["config"]["defaultTheme"] = fallback_theme
+    doc["quotes"] = [q for q in base.get("quotes", []) if q["theme"] in allowed]
+    doc["systemStatus"] = dict(base["systemStatus"], totalArtPieces=len(art_ids),
+                               tenant=tenant["id"])
+    text = render_catalog_text(doc, art_ids, _fanout_fragments)
+    shipped_ids = set(art_ids)
+    
+    path = Path(output_dir) / f"art-v2-{tenant['id']}.json"
+    write_atomic(path, text)
+    return {
+        "tenant": tenant["id"],
+        "file": str(path),
+        "pieces": len(art_ids),
+        "bytes": len(text.encode("utf-8")),
+        "missingPins": [art_id for art_id in pinned if art_id not in shipped_ids],
+        "defaultTheme": fallback_theme
+    }
+
+
+def load_tenants(tenants_path: str) -> List[Dict[str, Any]]:
+    """Read and check a tenants file."""
+    with open(tenants_path, 'r', encoding='utf-8') as f:
+        tenants = json.load(f).get("tenants", [])
+    
+    seen = set()
+    for i, tenant in enumerate(tenants):
+        tenant_id = tenant.get("id")
+        if not isinstance(tenant_id, str) or not _TENANT_ID.match(tenant_id):
+            raise ValueError(f"tenants[{i}]: invalid or missing 'id'")
+        if tenant_id in seen:
+            raise ValueError(f"tenants[{i}]: duplicate id '{tenant_id}'")
+        seen.add(tenant_id)
+        unknown = set(tenant.get("themes") or []) - set(THEMES)
+        if unknown:
+            raise ValueError(f"tenants[{i}]: unknown themes {sorted(unknown)}")
+    return tenants
+
+
+def render_tenant_catalogs(data: Dict[str, Any], tenants: List[Dict[str, Any]],
+                           output_dir: str, workers: int = None) -> List[Dict[str, Any]]:
+    """
+    Write one personalised catalog per tenant.
+    
+    Piece JSON is encoded once up front and handed to each worker process
+    a single time; tenants only choose which fragments to splice together.
+    """
+    fragments = _encode_art_fragments(data["art"])
+    base = dict(data, art=[{"id": a["id"], "theme": a["theme"]} for a in data["art"]])
+    
+    # Fail before any file is written rather than partway through the pool
+    for tenant in tenants:
+        default_theme = tenant.get("config", {}).get("defaultTheme")
+        if default_theme is not None:
+            shipped = _tenant_selection(tenant, base)[1]
+            if default_theme not in shipped:
+                raise ValueError(f"Tenant '{tenant['id']}': defaultTheme '{default_theme}' "
+                                 f"is not among its shipped themes {shipped}")
+    
+    if workers == 1 or len(tenants) <= 1:
+        _init_fanout(base, fragments)
+        return [_render_tenant(tenant, output_dir) for tenant in tenants]
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_fanout,
+                             initargs=(base, fragments)) as pool:
+        return list(pool.map(_render_tenant, tenants, [output_dir] * len(tenants)))
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Watch Mode
+# ═══════════════════════════════════════════════════════════════════
+#
+# Source tree layout (the theme folder is optional; --theme is the default):
+#   SOURCE/<theme>/<piece>.txt               static piece "<piece>"
+#   SOURCE/<theme>/<piece>/frame_1.txt ...   animated piece "<piece>"
+
+class SourceWatcher:
+    """
+    Polls a source art directory and republishes pieces as they change.
+    
+    Files are compared by mtime and size on every poll; a piece whose files
+    changed is re-hashed once edits have been quiet for `debounce` seconds,
+    and only pieces whose content really changed are re-ingested. The
+    catalog is re-rendered from cached per-piece JSON, so each publish only
+    encodes what changed.
+    """
+    
+    def __init__(self, generator: ContentGenerator, source_dir: str,
+                 theme: str = "abstract", export_dir: str = None,
+                 interval: float = 0.5, debounce: float = 0.3,
+                 frame_duration: int = 500):
+        self.gen = generator
+        self.source = Path(source_dir)
+        self.theme = theme
+        self.export_dir = Path(export_dir) if export_dir else None
+        self.interval = interval
+        self.debounce = debounce
+        self.frame_duration = frame_duration
+        self._stats = {}
+        self._hashes = {}
+        self._sources = {}
+        self._detected = {}
+        self._conflicts = set()
+        self._fragments = _encode_art_fragments(self.gen.data["art"])
+    
+    def scan(self) -> Dict[str, Dict[str, Any]]:
+        """Map each source piece ID to its theme, kind and file signatures."""
+        pieces = {}
+        conflicts = set()
+        for path in sorted(self.source.rglob("*.txt")):
+            parts = path.relative_to(self.source).parts
+            theme = self.theme
+            if parts[0] in THEMES and len(parts) > 1:
+                theme, parts = parts[0], parts[1:]
+            if len(parts) == 1:
+                art_id, kind = path.stem, "static"
+            elif len(parts) == 2:
+                art_id, kind = parts[0], "animated"
+            else:
+                continue
+            
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Deleted since rglob, or a dangling symlink
+            
+            piece = pieces.setdefault(art_id, {"theme": theme, "kind": kind, "files": {}})
+            if (piece["theme"], piece["kind"]) != (theme, kind):
+                # Warn once per conflict, not on every poll while it lasts
+                if str(path) not in self._conflicts:
+                    print(f"⚠ Duplicate source for '{art_id}': {path} (ignored)")
+                conflicts.add(str(path))
+                continue
+            piece["files"][str(path)] = (stat.st_mtime_ns, stat.st_size)
+        self._conflicts = conflicts
+        return pieces
+    
+    def poll(self) -> List[str]:
+        """Return IDs of pieces whose files were added, touched or deleted."""
+        current = self.scan()
+        changed = [art_id for art_id in set(current) | set(self._sources)
+                   if (current.get(art_id) or {}).get("files") != self._stats.get(art_id)]
+        self._sources = current
+        self._stats = {art_id: piece["files"] for art_id, piece in current.items()}
+        now = time.time()
+        for art_id in changed:
+            self._detected.setdefault(art_id, now)
+        return changed
+    
+    @staticmethod
+    def _hash(files: Dict[str, Any]) -> str:
+        digest = hashlib.sha1()
+        for path in sorted(files, key=lambda p: frame_sort_key(Path(p))):
+            digest.update(path.encode("utf-8") + b"\0")
+            digest.update(Path(path).read_bytes() + b"\0")
+        return digest.hexdigest()
+    
+    def _clear_export(self, art_id: str):
+        target = self.export_dir / "art" / art_id
+        if target.is_dir():
+            shutil.rmtree(target)
+        target.with_name(f"{art_id}.txt").unlink(missing_ok=True)
+    
+    def _ingest(self, art_id: str, piece: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a piece in the catalog, keeping its position (and the old piece on error)."""
+        art_list = self.gen.data["art"]
+        position = next((i for i, a in enumerate(art_list) if a["id"] == art_id), None)
+        old = art_list.pop(position) if position is not None else None
+        
+        files = sorted(piece["files"], key=lambda p: frame_sort_key(Path(p)))
+        title = art_id.replace('-', ' ').replace('_', ' ').title()
+        try:
+            if piece["kind"] == "static":
+                self.gen.add_art_from_file(files[0], art_id=art_id, title=title,
+                                           theme=piece["theme"])
+            else:
+                self.gen.create_animated_from_files(files, art_id=art_id, title=title,
+                                                    theme=piece["theme"],
+                                                    frame_duration=self.frame_duration)
+        except Exception:
+            if old is not None:
+                art_list.insert(position, old)
+            raise
+        
+        if position is not None:
+            art_list.insert(position, art_list.pop())
+        art = art_list[-1 if position is None else position]
+        self._fragments.update(_encode_art_fragments([art]))
+        return art
+    
+    def publish(self, changed: List[str]) -> List[str]:
+        """Re-ingest changed pieces, write the catalog, and return what was published."""
+        published = []
+        for art_id in sorted(changed):
+            piece = self._sources.get(art_id)
+            if piece is None:
+                if art_id in self._hashes:
+                    del self._hashes[art_id]
+                    self.gen.remove_art(art_id)
+                    self._fragments.pop(art_id, None)
+                    if self.export_dir:
+                        self._clear_export(art_id)
+                    published.append(art_id)
+                continue
+            
+            try:
+                digest = self._hash(piece["files"])
+            except FileNotFoundError:
+                continue  # Deleted mid-scan; the next poll will see it
+            except OSError as e:
+                print(f"⚠ Could not read {art_id}: {e}")
+                continue
+            if self._hashes.get(art_id) == digest:
+                continue
+            try:
+                art = self._ingest(art_id, piece)
+            except (OSError, UnicodeDecodeError, ValueError) as e:
+                # The old piece and its hash stay, so the next edit retries
+                print(f"⚠ Could not publish {art_id}: {e}")
+                continue
+            self._hashes[art_id] = digest
+            if self.export_dir:
+                self._clear_export(art_id)
+                (self.export_dir / "art").mkdir(parents=True, exist_ok=True)
+                export_art_piece(art, self.export_dir / "art")
+            published.append(art_id)
+        
+        if not published:
+            for art_id in changed:
+                self._detected.pop(art_id, None)
+            return published
+        
+        self.gen._update_stats()
+        art_ids = [art["id"] for art in self.gen.data["art"]]
+        write_atomic(self.gen.output_path, render_catalog_text(self.gen.data, art_ids, self._fragments))
+        if self.export_dir:
+            shutil.copyfile(self.gen.output_path, self.export_dir / "art-v2.json")
+        
+        now = time.time()
+        for art_id in published:
+            # A fresh mtime dates the edit; deletions only have the poll that saw them
+            edited_at = self._detected.get(art_id, now)
+            piece = self._sources.get(art_id)
+            if piece:
+                newest = max(mtime for mtime, _ in piece["files"].values()) / 1e9
+                if newest > edited_at - self.interval:
+                    edited_at = min(edited_at, newest)
+            print(f"✓ Published {art_id} ({(now - edited_at) * 1000:,.0f} ms after edit)")
+        for art_id in changed:
+            self._detected.pop(art_id, None)
+        return published
+    
+    def run(self):
+        """Watch until interrupted."""
+        print(f"👀 Watching {self.source} (Ctrl-C to stop)")
+        if self.export_dir:
+            # Start from a full export; after this only changed pieces are written
+            (self.export_dir / "art").mkdir(parents=True, exist_ok=True)
+            for art in self.gen.data["art"]:
+                export_art_piece(art, self.export_dir / "art")
+        pending = set(self.poll())
+        last_change = 0.0
+        try:
+            while True:
+                if pending and time.monotonic() - last_change >= self.debounce:
+                    self.publish(list(pending))
+                    pending.clear()
+                time.sleep(self.interval)
+                changed = self.poll()
+                if changed:
+                    pending.update(changed)
+                    last_change = time.monotonic()
+        except KeyboardInterrupt:
+            print("\n✓ Stopped watching")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Binary Pack Format
+# ═══════════════════════════════════════════════════════════════════
+#
+# Layout (little-endian):
+#   header   PACK_HEADER
+#   pieces   piece_count x PACK_PIECE   (id blob, skeleton blob, first body, body count)
+#   index    index_slots x uint32       (open-addressed crc32(id) -> piece + 1, 0 = empty)
+#   blobs    blob_count x PACK_BLOB     (offset into file, byte length)
+#   data     UTF-8 blobs back to back
+#
+# A piece's skeleton is its JSON with every body replaced by null, so it can
+# be rebuilt exactly; the catalog blob is the same for the top level.
+
+PACK_MAGIC = b"ASCP"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sHHIIIQQQQ")
+PACK_PIECE = struct.Struct("<IIII")
+PACK_BLOB = struct.Struct("<QQ")
+PACK_SLOT = struct.Struct("<I")
+
+
+def _pack_hash(art_id: bytes) -> int:
+    return zlib.crc32(art_id)
+
+
+def write_pack(data: Dict[str, Any], pack_path: str) -> int:
+    """Write a catalog as a pack file and return its size in bytes."""
+    blobs = []
+    
+    def add_blob(value: Any) -> int:
+        if not isinstance(value, str):
+            value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        blobs.append(value.encode("utf-8"))
+        return len(blobs) - 1
+    
+    catalog_blob = add_blob(dict(data, art=None))
+    
+    pieces = []
+    for art in data.get("art", []):
+        skeleton = dict(art)
+        if art.get("type") == "animated":
+            skeleton["frames"] = [dict(frame, content=None) for frame in art.get("frames", [])]
+        else:
+            skeleton["content"] = None
+        bodies = art_contents(art)
+        
+        id_blob = add_blob(art["id"])
+        skeleton_blob = add_blob(skeleton)
+        first_body = len(blobs)
+        for body in bodies:
+            add_blob(body)
+        pieces.append((id_blob, skeleton_blob, first_body, len(bodies)))
+    
+    # Keep the index at most half full so probes stay short
+    slots = 1
+    while slots < 2 * max(1, len(pieces)):
+        slots *= 2
+    index = [0] * slots
+    for i, art in enumerate(data.get("art", [])):
+        slot = _pack_hash(art["id"].encode("utf-8")) & (slots - 1)
+        while index[slot]:
+            slot = (slot + 1) & (slots - 1)
+        index[slot] = i + 1
+    
+    pieces_off = PACK_HEADER.size
+    index_off = pieces_off + PACK_PIECE.size * len(pieces)
+    blobs_off = index_off + PACK_SLOT.size * slots
+    data_off = blobs_off + PACK_BLOB.size * len(blobs)
+    
+    path = Path(pack_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(pieces), slots,
+                                 len(blobs), pieces_off, index_off, blobs_off, catalog_blob))
+        for piece in pieces:
+            f.write(PACK_PIECE.pack(*piece))
+        f.write(struct.pack(f"<{slots}I", *index))
+        offset = data_off
+        for blob in blobs:
+            f.write(PACK_BLOB.pack(offset, len(blob)))
+            offset += len(blob)
+        for blob in blobs:
+            f.write(blob)
+    
+    return path.stat().st_size
+
+
+class ArtPack:
+    """
+    Random-access reader for pack files.
+    
+    The file is memory-mapped; looking up a piece reads its table row and
+    hash slots, and returning a body slices it straight out of the map.
+    Nothing is decoded until asked for.
+    
+        with ArtPack("content/art.pack") as pack:
+            text = pack.content("matrix-rain", frame=2)
+    """
+    
+    def __init__(self, pack_path: str):
+        self.path = Path(pack_path)
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        
+        (magic, version, _, self.piece_count, self._slots, self._blob_count,
+         self._pieces_off, self._index_off, self._blobs_off,
+         self._catalog_blob) = PACK_HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"Not an art pack: {pack_path}")
+        if version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported pack version {version}: {pack_path}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __len__(self) -> int:
+        return self.piece_count
+    
+    def __contains__(self, art_id: str) -> bool:
+        return self.find(art_id) >= 0
+    
+    def close(self):
+        """
+        Release the memory map and file handle.
+        
+        Views returned by blob()/content_bytes() stay valid after closing;
+        the map itself is unmapped once the last of them is released.
+        """
+        if self._file is None:
+            return
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            # Views are still exported; dropping our references lets the
+            # mmap be freed when they go away
+            pass
+        finally:
+            self._file.close()
+            self._file = None
+            self._view = None
+            self._mmap = None
+    
+    def _check_open(self):
+        if self._mmap is None:
+            raise ValueError("pack is closed")
+    
+    def blob(self, index: int) -> memoryview:
+        """Raw bytes of a blob, as a zero-copy view into the pack."""
+        self._check_open()
+        if not 0 <= index < self._blob_count:
+            raise IndexError(f"Blob index out of range: {index}")
+        offset, length = PACK_BLOB.unpack_from(self._mmap, self._blobs_off + index * PACK_BLOB.size)
+        return self._view[offset:offset + length]
+    
+    def _piece(self, index: int):
+        self._check_open()
+        return PACK_PIECE.unpack_from(self._mmap, self._pieces_off + index * PACK_PIECE.size)
+    
+    def find(self, art_id: str) -> int:
+        """Return the position of a piece in the pack, or -1 if absent."""
+        self._check_open()
+        key = art_id.encode("utf-8")
+        mask = self._slots - 1
+        slot = _pack_hash(key) & mask
+        for _ in range(self._slots):
+            (entry,) = PACK_SLOT.unpack_from(self._mmap, self._index_off + slot * PACK_SLOT.size)
+            if not entry:
+                return -1
+            if self.blob(self._piece(entry - 1)[0]) == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+        return -1
+    
+    def _require(self, art_id: str):
+        index = self.find(art_id)
+        if index < 0:
+            raise KeyError(f"Art not found in pack: {art_id}")
+        return self._piece(index)
+    
+    def ids(self) -> List[str]:
+        """All piece IDs in catalog order."""
+        return [bytes(self.blob(self._piece(i)[0])).decode("utf-8")
+                for i in range(self.piece_count)]
+    
+    def frame_count(self, art_id: str) -> int:
+        """Number of bodies stored for a piece (1 for static art)."""
+        return self._require(art_id)[3]
+    
+    def content_bytes(self, art_id: str, frame: int = 1) -> memoryview:
+        """UTF-8 bytes of a static piece, or of one frame (1-based) of an animation."""
+        _, _, first_body, body_count = self._require(art_id)
+        if not 1 <= frame <= body_count:
+            raise IndexError(f"'{art_id}' has {body_count} frame(s), not {frame}")
+        return self.blob(first_body + frame - 1)
+    
+    def content(self, art_id: str, frame: int = 1) -> str:
+        """Decoded text of a static piece or of one animation frame."""
+        return str(self.content_bytes(art_id, frame), "utf-8")
+    
+    def piece(self, art_id: str) -> Dict[str, Any]:
+        """Rebuild a single piece exactly as it appears in the catalog."""
+        return self._rebuild(self._require(art_id))
+    
+    def _rebuild(self, record) -> Dict[str, Any]:
+        _, skeleton_blob, first_body, _ = record
+        art = json.loads(str(self.blob(skeleton_blob), "utf-8"))
+        if art.get("type") == "animated":
+            for i, frame in enumerate(art.get("frames", [])):
+                frame["content"] = str(self.blob(first_body + i), "utf-8")
+        else:
+            art["content"] = str(self.blob(first_body), "utf-8")
+        return art
+    
+    def catalog(self) -> Dict[str, Any]:
+        """Rebuild the full art-v2 catalog."""
+        data = json.loads(str(self.blob(self._catalog_blob), "utf-8"))
+        data["art"] = [self._rebuild(self._piece(i)) for i in range(self.piece_count)]
+        return data
+
+
+def read_pack(pack_path: str) -> Dict[str, Any]:
+    """Convert a pack file back into an art-v2 catalog."""
+    with ArtPack(pack_path) as pack:
+        return pack.catalog()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Columnar Schema (v3)
+# ═══════════════════════════════════════════════════════════════════
+#
+# v3 stores art as parallel columns instead of one object per piece:
+#   strings    shared table for themes, types, artists, complexities, dates
+#   art        id/title columns, string-table indexes, and a body range
+#              (bodyStart, bodyCount) per piece; bodyCount -1 = no body
+#   bodies     static content and frame content, back to back
+#   durations  one integer per body (0 for static content)
+#   palettes   distinct theme colour lists, referenced by index
+#   keyOrder   the source catalog's top-level key order
+#   passthrough  every other top-level value (config, quotes, ...), as-is
+#
+# A null column value means the key was absent. Anything that doesn't fit a
+# column (unusual keys, non-string values, irregular frames) is kept as-is in
+# the per-piece "extra" / "metaExtra" objects, so decoding is lossless.
+
+SCHEMA_V3_VERSION = "3.0.0"
+_V3_ART_STRINGS = ("theme", "type")
+_V3_META_STRINGS = ("artist", "created", "complexity")
+
+
+class _StringTable:
+    def __init__(self, strings: List[str] = None):
+        self.strings = list(strings or [])
+        self._index = {s: i for i, s in enumerate(self.strings)}
+    
+    def add(self, value: str) -> int:
+        if value not in self._index:
+            self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return self._index[value]
+
+
+def _take_column(source: Dict[str, Any], key: str, kind: type, extra: Dict[str, Any]):
+    """Return a column value for `key`, spilling odd values into `extra`."""
+    if key not in source:
+        return None
+    value = source[key]
+    if isinstance(value, kind) and not isinstance(value, bool):
+        return value
+    extra[key] = value
+    return None
+
+
+def _regular_frames(frames: Any) -> bool:
+    """True if frames are numbered 1..n with only frame/content/duration keys."""
+    if not isinstance(frames, list):
+        return False
+    for i, frame in enumerate(frames):
+        if (not isinstance(frame, dict) or list(frame) != ["frame", "content", "duration"]
+                or frame["frame"] != i + 1 or not isinstance(frame["content"], str)
+                or not isinstance(frame["duration"], int) or isinstance(frame["duration"], bool)):
+            return False
+    return True
+
+
+def catalog_to_v3(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a 2.x catalog to the columnar v3 schema."""
+    strings = _StringTable()
+    palettes = []
+    palette_index = {}
+    
+    def palette(colors: List[str]) -> int:
+        key = json.dumps(colors)
+        if key not in palette_index:
+            palette_index[key] = len(palettes)
+            palettes.append(colors)
+        return palette_index[key]
+    
+    themes = {"id": [], "name": [], "icon": [], "light": [], "dark": []}
+    raw_themes = {}
+    for theme_id, theme in data.get("themes", {}).items():
+        colors = theme.get("colors") if isinstance(theme, dict) else None
+        if (isinstance(theme, dict) and list(theme) == ["name", "icon", "colors"]
+                and isinstance(colors, dict) and list(colors) == ["light", "dark"]):
+            themes["id"].append(strings.add(theme_id))
+            themes["name"].append(theme["name"])
+            themes["icon"].append(theme["icon"])
+            themes["light"].append(palette(colors["light"]))
+            themes["dark"].append(palette(colors["dark"]))
+        else:
+            raw_themes[theme_id] = theme
+    
+    columns = {key: [] for key in ("id", "title", "theme", "type", "bodyStart", "bodyCount",
+                                   "artist", "created", "complexity", "metaExtra", "extra")}
+    bodies = []
+    durations = []
+    
+    for art in data.get("art", []):
+        extra = {}
+        columns["id"].append(_take_column(art, "id", str, extra))
+        columns["title"].append(_take_column(art, "title", str, extra))
+        for key in _V3_ART_STRINGS:
+            value = _take_column(art, key, str, extra)
+            columns[key].append(None if value is None else strings.add(value))
+        
+        body_key = "frames" if art.get("type") == "animated" else "content"
+        columns["bodyStart"].append(len(bodies))
+        if body_key == "content" and isinstance(art.get("content"), str):
+            bodies.append(art["content"])
+            durations.append(0)
+            columns["bodyCount"].append(1)
+        elif body_key == "frames" and _regular_frames(art.get("frames")):
+            bodies.extend(frame["content"] for frame in art["frames"])
+            durations.extend(frame["duration"] for frame in art["frames"])
+            columns["bodyCount"].append(len(art["frames"]))
+        else:
+            if body_key in art:
+                extra[body_key] = art[body_key]
+            columns["bodyCount"].append(-1)
+        
+        meta = art.get("metadata")
+        meta_extra = None
+        if isinstance(meta, dict):
+            meta_extra = {}
+            for key in _V3_META_STRINGS:
+                value = _take_column(meta, key, str, meta_extra)
+                columns[key].append(None if value is None else strings.add(value))
+            meta_extra.update({k: v for k, v in meta.items() if k not in _V3_META_STRINGS})
+            # An empty object still marks that the piece had metadata
+            if meta_extra == {} and any(k in meta for k in _V3_META_STRINGS):
+                meta_extra = None
+        else:
+            for key in _V3_META_STRINGS:
+                columns[key].append(None)
+            if "metadata" in art:
+                extra["metadata"] = meta
+        columns["metaExtra"].append(meta_extra)
+        
+        handled = {"id", "title", "theme", "type", body_key, "metadata"}
+        extra.update({k: v for k, v in art.items() if k not in handled and k not in extra})
+        columns["extra"].append(extra or None)
+    
+    return {
+        "version": SCHEMA_V3_VERSION,
+        "sourceVersion": data.get("version"),
+        # Nested so source keys can never collide with v3's own
+        "passthrough": {k: v for k, v in data.items() if k not in ("version", "themes", "art")},
+        "strings": strings.strings,
+        "palettes": palettes,
+        "themes": themes,
+        "themesRaw": raw_themes,
+        "themeOrder": list(data["themes"]) if "themes" in data else None,
+        "art": columns if "art" in data else None,
+        "bodies": bodies,
+        "durations": durations,
+        "keyOrder": list(data)
+    }
+
+
+def catalog_from_v3(v3: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the 2.x catalog a v3 document was made from."""
+    strings = v3["strings"]
+    palettes = v3["palettes"]
+    
+    def string(index: Optional[int]) -> Optional[str]:
+        return None if index is None else strings[index]
+    
+    themes = dict(v3["themesRaw"])
+    columns = v3["themes"]
+    for i, theme_index in enumerate(columns["id"]):
+        themes[strings[theme_index]] = {
+            "name": columns["name"][i],
+            "icon": columns["icon"][i],
+            "colors": {
+                "light": list(palettes[columns["light"][i]]),
+                "dark": list(palettes[columns["dark"][i]])
+            }
+        }
+    
+    art_list = []
+    columns = v3["art"] or {"id": []}
+    bodies, durations = v3["bodies"], v3["durations"]
+    for i in range(len(columns["id"])):
+        art = {}
+        for key in ("id", "title"):
+            if columns[key][i] is not None:
+                art[key] = columns[key][i]
+        for key in _V3_ART_STRINGS:
+            if columns[key][i] is not None:
+                art[key] = strings[columns[key][i]]
+        
+        start, count = columns["bodyStart"][i], columns["bodyCount"][i]
+        if count >= 0:
+            if art.get("type") == "animated":
+                art["frames"] = [
+                    {"frame": n + 1, "content": bodies[start + n], "duration": durations[start + n]}
+                    for n in range(count)
+                ]
+            else:
+                art["content"] = bodies[start]
+        
+        meta_values = {key: string(columns[key][i]) for key in _V3_META_STRINGS}
+        meta_extra = columns["metaExtra"][i]
+        if meta_extra is not None or any(v is not None for v in meta_values.values()):
+            meta = {k: v for k, v in meta_values.items() if v is not None}
+            meta.update(meta_extra or {})
+            art["metadata"] = meta
+        
+        art.update(columns["extra"][i] or {})
+        art_list.append(art)
+    
+    fields = dict(v3["passthrough"])
+    if "version" in v3["keyOrder"]:
+        fields["version"] = v3["sourceVersion"]
+    if v3["themeOrder"] is not None:
+        fields["themes"] = {theme_id: themes[theme_id] for theme_id in v3["themeOrder"]}
+    if v3["art"] is not None:
+        fields["art"] = art_list
+    
+    # Restore the source's top-level key order so a re-save is byte-identical
+    return {key: fields[key] for key in v3["keyOrder"]}
+
+
+def compare_schema_sizes(data: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    """Encoded sizes of a catalog as v2 and v3 (pretty, compact, gzipped)."""
+    sizes = {}
+    for name, doc in (("v2", data), ("v3", catalog_to_v3(data))):
+        pretty = json.dumps(doc, indent=2, ensure_ascii=False).encode("utf-8")
+        compact = json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        sizes[name] = {
+            "pretty": len(pretty),
+            "compact": len(compact),
+            "gzip": len(gzip.compress(compact, mtime=0))
+        }
+    return sizes
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Resident Daemon
+# ═══════════════════════════════════════════════════════════════════
+#
+# Protocol: one JSON object per line over a Unix socket, one JSON reply per
+# line. Requests look like {"cmd": "add", "art": {...}}; replies are
+# {"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+
+DAEMON_MUTATIONS = ("add", "remove")
+DAEMON_QUERIES = ("list", "stats", "validate")
+
+
+class ContentDaemon:
+    """
+    Keeps one ContentGenerator loaded and serves commands over a Unix socket.
+    
+    Mutations are applied in memory immediately, then wait for a group
+    commit: a single committer thread collects everything that arrives
+    within `commit_window` seconds and persists it with one atomic save.
+    A mutation is acknowledged only once the save containing it is on disk;
+    if that save fails, every mutation in the batch is undone in memory.
+    """
+    
+    def __init__(self, generator: ContentGenerator, socket_path: str,
+                 commit_window: float = 0.05):
+        self.gen = generator
+        self.socket_path = Path(socket_path)
+        self.commit_window = commit_window
+        self._cond = threading.Condition()
+        self._applied = 0
+        self._committed = 0
+        self._failures = []
+        self._undo = {}
+        self._running = False
+        self._server = None
+        self._committer = None
+    
+    # ─── Command handling ───
+    
+    def handle(self, request: Dict[str, Any]) -> Any:
+        """Execute one request and return its result."""
+        cmd = request.get("cmd")
+        if cmd in DAEMON_MUTATIONS:
+            return self._mutate(lambda: getattr(self, f"_cmd_{cmd}")(request))
+        if cmd in DAEMON_QUERIES:
+            with self._cond:
+                return getattr(self, f"_cmd_{cmd}")(request)
+        raise ValueError(f"Unknown command: {cmd}")
+    
+    # Mutations return (result, undo); undo reverts them if their save fails
+    
+    @staticmethod
+    def _unique_id(prefix: str, items: List[Dict[str, Any]]) -> str:
+        """A timestamped default ID, suffixed when several arrive in one second."""
+        taken = {item["id"] for item in items}
+        base = f"{prefix}-{int(datetime.now().timestamp())}"
+        item_id, n = base, 1
+        while item_id in taken:
+            n += 1
+            item_id = f"{base}-{n}"
+        return item_id
+    
+    def _drop(self, key: str, item_id: str):
+        self.gen.data[key] = [item for item in self.gen.data[key] if item["id"] != item_id]
+        self.gen._update_stats()
+    
+    def _cmd_add(self, request: Dict[str, Any]):
+        if "quote" in request:
+            quote = dict(request["quote"])
+            quote.setdefault("id", self._unique_id("quote", self.gen.data["quotes"]))
+            if any(q["id"] == quote["id"] for q in self.gen.data["quotes"]):
+                raise ValueError(f"Quote with ID '{quote['id']}' already exists")
+            quote_id = self.gen.add_quote(quote)
+            return quote_id, lambda: self._drop("quotes", quote_id)
+        
+        if "art" in request:
+            art_id = request["art"].get("id")
+        elif "path" in request:
+            art_id = request.get("id") or self._unique_id("custom", self.gen.data["art"])
+        else:
+            raise ValueError("add needs one of: art, quote, path")
+        # add_art skips an existing ID and returns it; that is not a success here
+        if any(a["id"] == art_id for a in self.gen.data["art"]):
+            raise ValueError(f"Art with ID '{art_id}' already exists")
+        
+        if "art" in request:
+            art_id = self.gen.add_art(request["art"])
+        else:
+            art_id = self.gen.add_art_from_file(
+                request["path"],
+                art_id=art_id,
+                title=request.get("title"),
+                theme=request.get("theme", "abstract"),
+                art_type=request.get("type", "static")
+            )
+        return art_id, lambda: self._drop("art", art_id)
+    
+    def _cmd_remove(self, request: Dict[str, Any]):
+        art_list = self.gen.data["art"]
+        position = next((i for i, a in enumerate(art_list) if a["id"] == request["id"]), None)
+        if position is None:
+            return self.gen.remove_art(request["id"]), None
+        art = art_list[position]
+        
+        def undo():
+            self.gen.data["art"].insert(position, art)
+            self.gen._update_stats()
+        return self.gen.remove_art(request["id"]), undo
+    
+    def _cmd_list(self, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [{k: art[k] for k in ("id", "title", "theme", "type")}
+                for art in self.gen.list_art(theme=request.get("theme"))]
+    
+    def _cmd_stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return self.gen.get_stats()
+    
+    def _cmd_validate(self, request: Dict[str, Any]) -> List[str]:
+        return self.gen.validate()
+    
+    # ─── Group commit ───
+    
+    def _mutate(self, apply):
+        with self._cond:
+            result, undo = apply()
+            self._applied += 1
+            ticket = self._applied
+            self._undo[ticket] = undo
+            self._cond.notify_all()
+            while self._committed < ticket:
+                self._cond.wait()
+            for first, last, error in self._failures:
+                if first <= ticket <= last:
+                    raise RuntimeError(f"Save failed, change not applied: {error}")
+        return result
+    
+    def _commit_loop(self):
+        while True:
+            with self._cond:
+                while self._running and self._committed == self._applied:
+                    self._cond.wait()
+                if not self._running and self._committed == self._applied:
+                    return
+            
+            # Let concurrent writers pile into this batch
+            time.sleep(self.commit_window)
+            
+            with self._cond:
+                first, last = self._committed + 1, self._applied
+                text = json.dumps(self.gen.data, indent=2, ensure_ascii=False)
+            
+            error = None
+            try:
+                write_atomic(self.gen.output_path, text)
+            except OSError as e:
+                error = str(e)
+            
+            with self._cond:
+                undos = [self._undo.pop(ticket) for ticket in range(first, last + 1)]
+                if error:
+                    # Newest first, so each undo sees the state it was made against
+                    for undo in reversed(undos):
+                        if undo is not None:
+                            undo()
+                    self._failures = (self._failures + [(first, last, error)])[-64:]
+                self._committed = last
+                self._cond.notify_all()
+            
+            if error:
+                print(f"⚠ Group commit of {last - first + 1} change(s) failed, rolled back: {error}")
+            else:
+                print(f"✓ Group commit of {last - first + 1} change(s) saved")
+    
+    # ─── Server lifecycle ───
+    
+    def serve_forever(self):
+        """Serve until interrupted, then flush pending changes and clean up."""
+        if self.socket_path.exists():
+            if daemon_running(str(self.socket_path)):
+                raise RuntimeError(f"Daemon already running on: {self.socket_path}")
+            self.socket_path.unlink()
+        
+        daemon = self
+        
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        reply = {"ok": True, "result": daemon.handle(json.loads(line))}
+                    except Exception as e:
+                        reply = {"ok": False, "error": str(e)}
+                    self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+        
+        self._running = True
+        self._committer = threading.Thread(target=self._commit_loop, daemon=True)
+        self._committer.start()
+        class Server(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+            # Automation fires many short-lived clients at once
+            request_queue_size = 128
+        
+        self._server = Server(str(self.socket_path), Handler)
+        print(f"✓ Serving {self.gen.output_path} on: {self.socket_path}")
+        
+        # Treat SIGTERM like Ctrl-C so service managers get a clean shutdown
+        def interrupt(signum, frame):
+            raise KeyboardInterrupt
+        signal.signal(signal.SIGTERM, interrupt)
+        signal.signal(signal.SIGINT, interrupt)
+        
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+    
+    def stop(self):
+        """Stop accepting requests and wait for the last group commit."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._committer is not None:
+            self._committer.join()
+            self._committer = None
+        print("✓ Daemon stopped")
+
+
+class DaemonClient:
+    """Thin client for a running ContentDaemon."""
+    
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(socket_path))
+        self.sock.settimeout(timeout)
+        self._reader = self.sock.makefile("rb")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        self._reader.close()
+        self.sock.close()
+    
+    def request(self, cmd: str, **params) -> Any:
+        """Send one command and return its result, raising on daemon errors."""
+        payload = dict(params, cmd=cmd)
+        self.sock.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Daemon closed the connection")
+        reply = json.loads(line)
+        if not reply["ok"]:
+            raise RuntimeError(reply["error"])
+        return reply["result"]
+
+
+def daemon_running(socket_path: str) -> bool:
+    """Check whether a daemon is accepting connections on a socket."""
+    try:
+        DaemonClient(socket_path, timeout=1.0).close()
+        return True
+    except OSError:
+        return False
+
+
 # ═══════════════════════════════════════════════════════════════════
 # CLI Interface
 # ═══════════════════════════════════════════════════════════════════
 
+def print_similarity_clusters(clusters: List[Dict[str, Any]]):
+    total = sum(cluster["bytes"] for cluster in clusters)
+    print(f"\n🔍 {len(clusters)} near-duplicate clusters ({total:,} bytes reclaimable)")
+    for cluster in clusters:
+        print(f"\n  keep {cluster['keep']}")
+        for dup in cluster["duplicates"]:
+            print(f"    ~ {dup['id']:<40} {dup['similarity']:.0%}  {dup['bytes']:>8,} bytes")
+
+
+def export_art_piece(art: Dict[str, Any], art_dir: Path):
+    """Write one piece as a text file (static) or a folder of frame files."""
+    if art["type"] == "static":
+        filepath = art_dir / f"{art['id']}.txt"
+        filepath.write_text(art["content"], encoding='utf-8')
+    else:
+        anim_dir = art_dir / art['id']
+        anim_dir.mkdir(exist_ok=True)
+        for frame in art["frames"]:
+            filepath = anim_dir / f"frame_{frame['frame']}.txt"
+            filepath.write_text(frame["content"], encoding='utf-8')
+
+
+def print_art_list(art_list: List[Dict[str, Any]]):
+    print(f"\n{'ID':<30} {'Title':<30} {'Theme':<15} {'Type':<10}")
+    print("-" * 85)
+    for art in art_list:
+        print(f"{art['id']:<30} {art['title']:<30} {art['theme']:<15} {art['type']:<10}")
+
+
+def print_theme_list(theme: str, art_list: List[Dict[str, Any]]):
+    print(f"\nArt pieces with theme '{theme}':")
+    for art in art_list:
+        print(f"  - {art['title']} ({art['id']})")
+
+
+def print_validation(errors: List[str]):
+    if errors:
+        print("❌ Validation errors:")
+        for error in errors:
+            print(f"  - {error}")
+    else:
+        print("✅ Content is valid!")
+
+
+def print_stats(stats: Dict[str, Any]):
+    print("\n📊 Content Statistics")
+    print("=" * 40)
+    print(f"Total Art Pieces: {stats['totalArt']}")
+    print(f"Total Quotes: {stats['totalQuotes']}")
+    print(f"Total Easter Eggs: {stats['totalEasterEggs']}")
+    print(f"Version: {stats['version']}")
+    print(f"Last Updated: {stats['lastUpdated']}")
+    print("\nBy Theme:")
+    for theme, count in sorted(stats['themes'].items()):
+        print(f"  {theme}: {count}")
+
+
+def dynamic_art_from_args(args) -> List[Dict[str, Any]]:
+    """Build crypto/weather art from live data (--data-url) or mock values."""
+    kind = "crypto" if args.crypto else "weather"
+    keys = [k.strip() for k in (args.crypto or args.weather).split(",") if k.strip()]
+    keys = list(dict.fromkeys(keys))
+    if args.data_url:
+        return fetch_dynamic_art(kind, keys, args.data_url, timeout=args.data_timeout)
+    
+    # Mock data for demo
+    if kind == "crypto":
+        return [generate_crypto_art(symbol, random.uniform(20000, 70000), random.uniform(-10, 10))
+                for symbol in keys]
+    art_list = []
+    for condition in keys:
+        art = generate_weather_art(condition, random.randint(30, 90))
+        # As in fetch_weather_art, several cards share a second; keep IDs apart
+        slug = re.sub(r"[^a-z0-9]+", "-", condition.lower()).strip("-")
+        art["id"] = f"weather-{slug}-{int(datetime.now().timestamp())}"
+        art_list.append(art)
+    return art_list
+
+
+def forward_to_daemon(args) -> bool:
+    """Run a CLI command against a resident daemon; False if unsupported."""
+    with DaemonClient(args.socket) as client:
+        if args.add_art:
+            art_id = client.request("add", path=str(Path(args.add_art).resolve()),
+                                    title=args.title, theme=args.theme, type=args.type)
+            print(f"✓ Added art: {art_id}")
+        elif args.add_quote:
+            # The daemon assigns the ID so concurrent clients never collide
+            quote = {
+                "text": args.add_quote,
+                "theme": args.theme,
+                "author": args.quote_author
+            }
+            print(f"✓ Added quote: {client.request('add', quote=quote)}")
+        elif args.remove:
+            if client.request("remove", id=args.remove):
+                print(f"✓ Removed art: {args.remove}")
+            else:
+                print(f"⚠ Art not found: {args.remove}")
+        elif args.list:
+            print_art_list(client.request("list"))
+        elif args.list_theme:
+            print_theme_list(args.list_theme, client.request("list", theme=args.list_theme))
+        elif args.validate:
+            print_validation(client.request("validate"))
+        elif args.stats:
+            print_stats(client.request("stats"))
+        elif args.crypto or args.weather:
+            for art in dynamic_art_from_args(args):
+                print(f"✓ Added art: {client.request('add', art=art)}")
+        else:
+            return False
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="ASCII Art Widget Content Generator",
@@ -755,10 +3167,22 @@ def main():
 Examples:
   %(prog)s                              # Generate default content
   %(prog)s --add-art myart.txt          # Add art from file
+  %(prog)s --add-image frames/ --dither # Animated art from PGM/PPM frames
+  %(prog)s --procedural rain --seed 7 --frames 48
   %(prog)s --add-quote "Hello World"    # Add a quote
   %(prog)s --validate                   # Check JSON validity
   %(prog)s --stats                      # Show content statistics
   %(prog)s --export ./output            # Export to directory
+  %(prog)s --report --max-bytes 65536   # Where the bytes go; fail over budget
+  %(prog)s --report --diff old.json     # Size changes since another version
+  %(prog)s --dedupe --threshold 0.9     # Drop near-identical pieces
+  %(prog)s --bundle ./dist --bundle-budget small=8192
+  %(prog)s --fan-out tenants.json ./dist
+  %(prog)s --watch ./art-src --export ./output
+  %(prog)s --to-v3 content/art-v3.json  # Compact columnar schema
+  %(prog)s --serve                      # Keep content loaded, serve on a socket
+  %(prog)s --socket content/art-v2.json.sock --stats
+  %(prog)s --pack content/art.pack       # Binary pack for random access
         """
     )
     
@@ -766,6 +3190,18 @@ Examples:
                        help='Output JSON file path (default: content/art-v2.json)')
     parser.add_argument('--add-art', metavar='FILE',
                        help='Add art from text file')
+    parser.add_argument('--add-image', metavar='IMAGE', nargs='+',
+                       help='Add art from PGM/PPM images or a frame directory')
+    parser.add_argument('--width', type=int, default=34,
+                       help='Character width for image art (default: 34)')
+    parser.add_argument('--dither', action='store_true',
+                       help='Apply ordered dithering to image art')
+    parser.add_argument('--invert', action='store_true',
+                       help='Invert image luminance (dark glyphs for bright pixels)')
+    parser.add_argument('--frame-duration', type=int, default=500,
+                       help='Frame duration in ms for animated art (default: 500)')
+    parser.add_argument('--workers', type=int,
+                       help='Worker processes for image conversion and fan-out')
     parser.add_argument('--title', '-t',
                        help='Title for new art')
     parser.add_argument('--theme', default='abstract',
@@ -789,13 +3225,79 @@ Examples:
                        help='Remove art by ID')
     parser.add_argument('--export', metavar='DIR',
                        help='Export content to directory')
+    parser.add_argument('--similar', action='store_true',
+                       help='Report clusters of near-duplicate art')
+    parser.add_argument('--dedupe', action='store_true',
+                       help='Remove near-duplicate art, keeping one piece per cluster')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                       help='Similarity for --similar/--dedupe (default: 0.5)')
+    parser.add_argument('--report', action='store_true',
+                       help='Show payload bytes by section, field, theme and piece')
+    parser.add_argument('--diff', metavar='OLD_FILE',
+                       help='With --report, compare against another catalog file')
+    parser.add_argument('--top', type=int, default=10,
+                       help='Number of largest pieces to report (default: 10)')
+    parser.add_argument('--max-bytes', type=int,
+                       help='With --report, exit non-zero if the catalog exceeds this size')
+    parser.add_argument('--max-piece-bytes', type=int,
+                       help='With --report, exit non-zero if any piece exceeds this size')
+    parser.add_argument('--procedural', metavar='KIND', choices=list(PROCEDURAL_GENERATORS),
+                       help='Add a procedural animation (rain, progress, stream)')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Seed for procedural animations')
+    parser.add_argument('--frames', type=int, default=24,
+                       help='Frame count for procedural animations (default: 24)')
+    parser.add_argument('--bundle', metavar='DIR',
+                       help='Write byte-budgeted bundles per widget size')
+    parser.add_argument('--bundle-budget', metavar='SIZE=BYTES', action='append', default=[],
+                       help='Override a bundle byte budget (repeatable)')
+    parser.add_argument('--recent', metavar='FILE',
+                       help='File of recently shown art IDs, most recent first')
+    parser.add_argument('--watch', metavar='DIR',
+                       help='Watch a source art directory and republish changes')
+    parser.add_argument('--poll-interval', type=float, default=0.5,
+                       help='Seconds between source scans in --watch (default: 0.5)')
+    parser.add_argument('--debounce', type=float, default=0.3,
+                       help='Quiet seconds before --watch republishes (default: 0.3)')
+    parser.add_argument('--fan-out', nargs=2, metavar=('TENANTS', 'DIR'),
+                       help='Render per-tenant catalogs from a tenants file')
+    parser.add_argument('--pack', metavar='FILE',
+                       help='Write content as a random-access binary pack')
+    parser.add_argument('--unpack', metavar='FILE',
+                       help='Convert a binary pack back to the output JSON')
+    parser.add_argument('--to-v3', metavar='FILE',
+                       help='Write content in the compact v3 schema and compare sizes')
+    parser.add_argument('--from-v3', metavar='FILE',
+                       help='Convert a v3 file back to the v2 output JSON')
+    parser.add_argument('--serve', action='store_true',
+                       help='Run as a resident daemon on a Unix socket')
+    parser.add_argument('--socket', metavar='PATH',
+                       help='Daemon socket (default for --serve: OUTPUT.sock); '
+                            'other commands are forwarded to it')
+    parser.add_argument('--commit-window', type=float, default=0.05,
+                       help='Seconds the daemon batches changes before saving')
     parser.add_argument('--crypto', metavar='SYMBOL',
-                       help='Generate crypto price art')
+                       help='Generate crypto price art (comma-separated symbols)')
     parser.add_argument('--weather', metavar='CONDITION',
-                       help='Generate weather art')
+                       help='Generate weather art (a location when using --data-url)')
+    parser.add_argument('--data-url', metavar='URL',
+                       help='Live JSON source for --crypto/--weather, with a {keys} placeholder')
+    parser.add_argument('--data-timeout', type=float, default=10.0,
+                       help='Timeout in seconds for --data-url requests')
     
     args = parser.parse_args()
     
+    # Forward to a resident daemon instead of loading the file ourselves
+    if args.socket and not args.serve:
+        try:
+            forwarded = forward_to_daemon(args)
+        except RuntimeError as e:
+            print(f"❌ Daemon error: {e}")
+            sys.exit(1)
+        if not forwarded:
+            parser.error("this command is not available through --socket")
+        return
+    
     # Initialize generator
     gen = ContentGenerator(args.output)
     
@@ -803,7 +3305,16 @@ Examples:
     gen.load()
     
     # Handle commands
-    if args.add_art:
+    if args.serve:
+        socket_path = args.socket or f"{gen.output_path}.sock"
+        ContentDaemon(gen, socket_path, commit_window=args.commit_window).serve_forever()
+    
+    elif args.watch:
+        SourceWatcher(gen, args.watch, theme=args.theme, export_dir=args.export,
+                      interval=args.poll_interval, debounce=args.debounce,
+                      frame_duration=args.frame_duration).run()
+    
+    elif args.add_art:
         gen.add_art_from_file(
             args.add_art,
             title=args.title,
@@ -812,6 +3323,32 @@ Examples:
         )
         gen.save()
     
+    elif args.add_image:
+        gen.add_art_from_images(
+            args.add_image,
+            title=args.title,
+            theme=args.theme,
+            width=args.width,
+            dither=args.dither,
+            invert=args.invert,
+            frame_duration=args.frame_duration,
+            workers=args.workers
+        )
+        gen.save()
+    
+    elif args.procedural:
+        art = generate_procedural_art(
+            args.procedural,
+            seed=args.seed,
+            frame_count=args.frames,
+            width=args.width,
+            frame_duration=args.frame_duration
+        )
+        if args.title:
+            art["title"] = args.title
+        gen.add_art(art)
+        gen.save()
+    
     elif args.add_quote:
         quote = {
             "id": f"quote-{int(datetime.now().timestamp())}",
@@ -827,39 +3364,42 @@ Examples:
         gen.save()
     
     elif args.list:
-        art_list = gen.list_art()
-        print(f"\n{'ID':<30} {'Title':<30} {'Theme':<15} {'Type':<10}")
-        print("-" * 85)
-        for art in art_list:
-            print(f"{art['id']:<30} {art['title']:<30} {art['theme']:<15} {art['type']:<10}")
+        print_art_list(gen.list_art())
     
     elif args.list_theme:
-        art_list = gen.list_art(theme=args.list_theme)
-        print(f"\nArt pieces with theme '{args.list_theme}':")
-        for art in art_list:
-            print(f"  - {art['title']} ({art['id']})")
+        print_theme_list(args.list_theme, gen.list_art(theme=args.list_theme))
     
     elif args.validate:
-        errors = gen.validate()
-        if errors:
-            print("❌ Validation errors:")
-            for error in errors:
-                print(f"  - {error}")
-        else:
-            print("✅ Content is valid!")
+        print_validation(gen.validate())
     
     elif args.stats:
-        stats = gen.get_stats()
-        print("\n📊 Content Statistics")
-        print("=" * 40)
-        print(f"Total Art Pieces: {stats['totalArt']}")
-        print(f"Total Quotes: {stats['totalQuotes']}")
-        print(f"Total Easter Eggs: {stats['totalEasterEggs']}")
-        print(f"Version: {stats['version']}")
-        print(f"Last Updated: {stats['lastUpdated']}")
-        print("\nBy Theme:")
-        for theme, count in sorted(stats['themes'].items()):
-            print(f"  {theme}: {count}")
+        print_stats(gen.get_stats())
+    
+    elif args.similar:
+        clusters = find_near_duplicates(gen.data["art"], threshold=args.threshold)
+        print_similarity_clusters(clusters)
+    
+    elif args.dedupe:
+        clusters = gen.dedupe(threshold=args.threshold)
+        print_similarity_clusters(clusters)
+        if clusters:
+            gen.save()
+    
+    elif args.report:
+        report = payload_report(gen.data, top=args.top)
+        if args.diff:
+            with open(args.diff, 'r', encoding='utf-8') as f:
+                old_report = payload_report(json.load(f))
+            print_payload_diff(diff_payload_reports(old_report, report, top=args.top))
+        else:
+            print_payload_report(report)
+        
+        violations = check_payload_budget(report, args.max_bytes, args.max_piece_bytes)
+        if violations:
+            print("\n❌ Over payload budget:")
+            for violation in violations:
+                print(f"  - {violation}")
+            sys.exit(1)
     
     elif args.export:
         export_dir = Path(args.export)
@@ -875,33 +3415,68 @@ Examples:
         art_dir.mkdir(exist_ok=True)
         
         for art in gen.data["art"]:
-            if art["type"] == "static":
-                filepath = art_dir / f"{art['id']}.txt"
-                filepath.write_text(art["content"], encoding='utf-8')
-            else:
-                anim_dir = art_dir / art['id']
-                anim_dir.mkdir(exist_ok=True)
-                for frame in art["frames"]:
-                    filepath = anim_dir / f"frame_{frame['frame']}.txt"
-                    filepath.write_text(frame["content"], encoding='utf-8')
+            export_art_piece(art, art_dir)
         
         print(f"✓ Exported to: {export_dir}")
     
-    elif args.crypto:
-        # Generate crypto art (mock data for demo)
-        import random
-        price = random.uniform(20000, 70000)
-        change = random.uniform(-10, 10)
-        art = generate_crypto_art(args.crypto, price, change)
-        gen.add_art(art)
+    elif args.bundle:
+        budgets = {}
+        for spec in args.bundle_budget:
+            size, _, value = spec.partition('=')
+            if size not in WIDGET_SIZES or not value.isdigit():
+                parser.error(f"invalid --bundle-budget '{spec}' (expected SIZE=BYTES)")
+            budgets[size] = int(value)
+        
+        recent = []
+        if args.recent:
+            recent = [line.strip() for line in
+                      Path(args.recent).read_text(encoding='utf-8').splitlines()
+                      if line.strip()]
+        
+        gen.export_size_bundles(args.bundle, budgets, recent)
+    
+    elif args.fan_out:
+        tenants_path, out_dir = args.fan_out
+        results = render_tenant_catalogs(gen.data, load_tenants(tenants_path),
+                                         out_dir, workers=args.workers)
+        for result in results:
+            print(f"✓ {result['tenant']}: {result['pieces']} pieces, "
+                  f"{result['bytes']:,} bytes -> {result['file']}")
+            for art_id in result["missingPins"]:
+                print(f"  ⚠ Pinned art not found: {art_id}")
+            if result["defaultTheme"]:
+                print(f"  ⚠ Base defaultTheme not shipped; using: {result['defaultTheme']}")
+    
+    elif args.pack:
+        size = write_pack(gen.data, args.pack)
+        print(f"✓ Packed {len(gen.data['art'])} pieces to: {args.pack}")
+        print(f"  File size: {size:,} bytes")
+    
+    elif args.unpack:
+        gen.data = read_pack(args.unpack)
+        print(f"✓ Unpacked: {args.unpack}")
         gen.save()
     
-    elif args.weather:
-        # Generate weather art
-        import random
-        temp = random.randint(30, 90)
-        art = generate_weather_art(args.weather, temp)
-        gen.add_art(art)
+    elif args.to_v3:
+        write_atomic(Path(args.to_v3), json.dumps(catalog_to_v3(gen.data), ensure_ascii=False,
+                                                  separators=(",", ":")))
+        print(f"✓ Wrote v3 schema to: {args.to_v3}")
+        sizes = compare_schema_sizes(gen.data)
+        print(f"\n{'Encoding':<10} {'v2':>12} {'v3':>12} {'Saved':>8}")
+        print("-" * 45)
+        for encoding in ("pretty", "compact", "gzip"):
+            v2, v3 = sizes["v2"][encoding], sizes["v3"][encoding]
+            print(f"{encoding:<10} {v2:>12,} {v3:>12,} {1 - v3 / v2:>8.1%}")
+    
+    elif args.from_v3:
+        with open(args.from_v3, 'r', encoding='utf-8') as f:
+            gen.data = catalog_from_v3(json.load(f))
+        print(f"✓ Converted from v3: {args.from_v3}")
+        gen.save()
+    
+    elif args.crypto or args.weather:
+        for art in dynamic_art_from_args(args):
+            gen.add_art(art)
         gen.save()
     
     else: